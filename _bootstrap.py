@@ -0,0 +1,45 @@
+"""
+Shared setup for the debug and demo scripts.
+Puts the project root on sys.path once and re-exports the
+forum and agent classes those scripts work with.
+"""
+import os
+import sys
+
+_project_root = os.path.dirname(os.path.abspath(__file__))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from philosopher_dinner.forum.state import ForumState, ForumConfig, ForumMode, Message, MessageType
+from philosopher_dinner.agents.socrates import SocratesAgent
+from philosopher_dinner.forum.graph import PhilosopherForum
+
+# SocratesAgent built once per process by init_agents(), used when the
+# debug drivers run as tasks in a ProcessPoolExecutor worker
+_agent_singleton = None
+
+
+def init_agents():
+    """Pool initializer: build this worker's shared SocratesAgent"""
+    global _agent_singleton
+    _agent_singleton = SocratesAgent()
+
+
+def get_socrates():
+    """Return the worker's pre-built SocratesAgent, or a fresh one"""
+    if _agent_singleton is not None:
+        return _agent_singleton
+    return SocratesAgent()
+
+
+__all__ = [
+    "ForumState",
+    "ForumConfig",
+    "ForumMode",
+    "Message",
+    "MessageType",
+    "SocratesAgent",
+    "PhilosopherForum",
+    "init_agents",
+    "get_socrates",
+]
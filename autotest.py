@@ -8,33 +8,90 @@ import os
 import sys
 import subprocess
 import argparse
-import json
+import importlib
+import tempfile
+import threading
+import concurrent.futures
+from functools import partial
 from pathlib import Path
 from github_issue_manager import GitHubIssueManager
 
+# Short names accepted by --test
+TEST_FILES = {
+    "cli": "test_cli_interactions.py",
+    "langgraph": "test_langgraph_flows.py", 
+    "agent": "test_agent_behavior.py"
+}
+
+# Tests that drive the real CLI against the shared forums.db, so they
+# never share a partition or run alongside other partitions. The
+# comprehensive suite (--full) includes them, so it is scheduled the same way
+REQUIRE_SERIAL = {"real_cli_execution"}
+
+# Top-level directories whose Python files the watcher tracks
+WATCH_PREFIXES = ("philosopher_dinner", "tests")
+
+# (module, function) pairs run by --demos
+DEBUG_DRIVERS = [
+    ("demo", "demo_conversation"),
+    ("debug_interactive", "interactive_debug"),
+]
+
+# Suites may run concurrently, so each output line is written under this lock
+_output_lock = threading.Lock()
+
+def run_command_async(cmd, cwd=None):
+    """Start a command and return its Popen handle without waiting"""
+    return subprocess.Popen(
+        cmd,
+        shell=True,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True
+    )
+
 def run_command(cmd, description, cwd=None):
-    """Run a command and handle output"""
-    print(f"\n🔧 {description}")
-    print("-" * 40)
+    """Run a command, streaming its output as it is produced.
+    
+    Returns (success, output), with stderr interleaved into the output.
+    """
+    # Suites started by run_jobs' thread pool tag their lines so that
+    # interleaved output stays attributable
+    prefix = "" if threading.current_thread() is threading.main_thread() else f"[{description}] "
+    
+    with _output_lock:
+        print(f"\n🔧 {description}")
+        print("-" * 40)
     
     try:
-        result = subprocess.run(
-            cmd, 
-            shell=True, 
-            cwd=cwd,
-            capture_output=True, 
-            text=True
-        )
-        
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        
-        return result.returncode == 0, result.stdout, result.stderr
-        
+        proc = run_command_async(cmd, cwd)
+        out_lines = []
+        for line in iter(proc.stdout.readline, ""):
+            with _output_lock:
+                sys.stdout.write(prefix + line)
+                sys.stdout.flush()
+            out_lines.append(line)
+        proc.wait()
     except Exception as e:
-        print(f"❌ Error: {e}")
-        return False, "", str(e)
+        with _output_lock:
+            print(f"{prefix}❌ Error: {e}")
+        return False, str(e)
+    
+    return proc.returncode == 0, "".join(out_lines)
+
+def run_jobs(jobs, serial=False):
+    """Run independent test suites, in parallel unless serial is requested"""
+    if serial or len(jobs) < 2:
+        results = [job() for job in jobs]
+    else:
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(job) for job in jobs]
+            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+    
+    return all(ok for ok, _ in results)
 
 def setup_pre_commit_hook():
     """Set up pre-commit hook for automatic testing"""
@@ -102,24 +159,99 @@ def run_comprehensive_tests():
         cwd="tests"
     )
 
-def run_specific_test(test_name):
-    """Run a specific test file"""
+def run_specific_test(test_files):
+    """Run one partition of test files in a single pytest process"""
     return run_command(
-        f"{sys.executable} {test_name}",
-        f"Running {test_name}",
+        f"{sys.executable} -m pytest -q {' '.join(test_files)}",
+        f"Running {', '.join(test_files)}",
         cwd="tests"
     )
 
+def build_test_jobs(test_names):
+    """Split the requested test files into xargs-style partitions.
+    
+    Returns (parallel_jobs, serial_jobs). Files are dealt round-robin into at
+    most os.cpu_count() partitions; files listed in REQUIRE_SERIAL each get
+    their own job, meant to run after the parallel ones.
+    """
+    parallel_files = []
+    serial_files = []
+    for name in test_names:
+        test_file = TEST_FILES.get(name, f"test_{name}.py")
+        if name in REQUIRE_SERIAL:
+            serial_files.append(test_file)
+        else:
+            parallel_files.append(test_file)
+    
+    parallel_jobs = []
+    if parallel_files:
+        n = min(len(parallel_files), os.cpu_count() or 1)
+        parallel_jobs = [partial(run_specific_test, parallel_files[i::n]) for i in range(n)]
+    
+    serial_jobs = [partial(run_specific_test, [test_file]) for test_file in serial_files]
+    return parallel_jobs, serial_jobs
+
+def _run_debug_driver(module_name, func_name):
+    """Worker task: import a debug script and run its entry point"""
+    module = importlib.import_module(module_name)
+    getattr(module, func_name)()
+    return module_name
+
+def run_debug_drivers():
+    """Run the demo/debug drivers on a process pool.
+    
+    Each worker builds one SocratesAgent in its initializer and every driver
+    it runs reuses it, instead of constructing a new agent per driver.
+    """
+    import _bootstrap
+    
+    print("\n🔧 Running debug drivers")
+    print("-" * 40)
+    
+    success = True
+    workers = min(len(DEBUG_DRIVERS), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_bootstrap.init_agents) as executor:
+        futures = {
+            executor.submit(_run_debug_driver, module_name, func_name): module_name
+            for module_name, func_name in DEBUG_DRIVERS
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+                print(f"✅ {futures[future]} completed")
+            except Exception as e:
+                print(f"❌ {futures[future]} failed: {e}")
+                success = False
+    
+    return success
+
+def collect_watch_paths():
+    """List the Python files under WATCH_PREFIXES for the watcher to track"""
+    return sorted(
+        str(path) for path in Path(".").rglob("*.py")
+        if path.parts[0] in WATCH_PREFIXES and "__pycache__" not in path.parts
+    )
+
 def start_file_watcher():
     """Start the file watcher for development"""
     print("🔍 Starting development file watcher...")
     print("This will watch for changes and automatically run tests.")
     print("Press Ctrl+C to stop.")
     
+    # Hand the watcher an explicit file list so it stats only those files
+    # rather than rescanning whole directory trees on every poll
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as paths_file:
+        paths_file.write("\n".join(collect_watch_paths()))
+    
+    # Run the watcher in this interpreter instead of starting a second one
+    import watch_tests
+    
     try:
-        subprocess.run([sys.executable, "watch_tests.py"])
+        watch_tests.main(["--paths-from", paths_file.name, "--debounce-ms", "200"])
     except KeyboardInterrupt:
         print("\n👋 File watcher stopped.")
+    finally:
+        os.unlink(paths_file.name)
 
 def main():
     """Main function with argument parsing"""
@@ -133,7 +265,10 @@ Examples:
   python autotest.py --watch              # Start file watcher
   python autotest.py --setup              # Set up pre-commit hook
   python autotest.py --test cli           # Run specific test
+  python autotest.py --test cli agent     # Run several tests in parallel
   python autotest.py --pre-commit         # Run pre-commit tests
+  python autotest.py --demos              # Run the demo/debug drivers
+  python autotest.py --full --test cli --serial  # Run suites one at a time
         """
     )
     
@@ -163,8 +298,8 @@ Examples:
     
     parser.add_argument(
         "--test", 
-        type=str,
-        help="Run specific test (e.g., 'cli', 'langgraph', 'agent')"
+        nargs="+",
+        help="Run specific tests (e.g., 'cli', 'langgraph', 'agent')"
     )
     
     parser.add_argument(
@@ -173,10 +308,22 @@ Examples:
         help="Run pre-commit test sequence"
     )
     
+    parser.add_argument(
+        "--demos", 
+        action="store_true",
+        help="Run the demo and debug drivers as a smoke test"
+    )
+    
+    parser.add_argument(
+        "--serial", 
+        action="store_true",
+        help="Run selected suites one after another instead of in parallel"
+    )
+    
     args = parser.parse_args()
     
     # If no arguments, show help
-    if not any(vars(args).values()):
+    if not any(value for name, value in vars(args).items() if name != "serial"):
         parser.print_help()
         return
     
@@ -188,21 +335,29 @@ Examples:
     if args.setup:
         success = setup_pre_commit_hook() and success
     
+    jobs = []
+    
     if args.quick or args.pre_commit:
-        success = run_simple_tests() and success
+        jobs.append(run_simple_tests)
     
-    if args.full:
-        success = run_comprehensive_tests() and success
+    serial_jobs = []
     
     if args.test:
-        test_files = {
-            "cli": "test_cli_interactions.py",
-            "langgraph": "test_langgraph_flows.py", 
-            "agent": "test_agent_behavior.py"
-        }
-        
-        test_file = test_files.get(args.test, f"test_{args.test}.py")
-        success = run_specific_test(test_file) and success
+        test_jobs, serial_jobs = build_test_jobs(args.test)
+        jobs.extend(test_jobs)
+    
+    if args.full:
+        # Includes the real CLI tests, which use the shared forums.db
+        serial_jobs.append(run_comprehensive_tests)
+    
+    if jobs:
+        success = run_jobs(jobs, serial=args.serial) and success
+    
+    if serial_jobs:
+        success = run_jobs(serial_jobs, serial=True) and success
+    
+    if args.demos:
+        success = run_debug_drivers() and success
     
     if args.watch:
         start_file_watcher()
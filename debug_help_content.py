@@ -7,7 +7,8 @@ import sys
 import os
 from unittest.mock import patch
 
-# Add project to path
+# Add project to path; _bootstrap would also import the forum graph, which
+# the help check doesn't need
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from philosopher_dinner.cli.interface import PhilosopherCLI
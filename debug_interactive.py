@@ -4,17 +4,11 @@ Interactive debug version of Philosopher Dinner.
 Simulates a conversation step by step.
 """
 
-import sys
-import os
 from datetime import datetime
 
-# Add project to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import ForumState, ForumConfig, ForumMode, Message, MessageType, get_socrates
 
-from philosopher_dinner.forum.state import ForumState, ForumConfig, ForumMode, Message, MessageType
-from philosopher_dinner.agents.socrates import SocratesAgent
-
-def interactive_debug():
+def interactive_debug(socrates=None):
     """Run an interactive debugging session"""
     
     print("🔧 PHILOSOPHER DINNER - INTERACTIVE DEBUG")
@@ -22,11 +16,15 @@ def interactive_debug():
     
     # Create Socrates
     print("1. Creating Socrates agent...")
-    socrates = SocratesAgent()
+    if socrates is None:
+        socrates = get_socrates()
     print(f"   ✅ Socrates created: {socrates.name}")
     print(f"   📚 Expertise: {socrates.expertise_areas[:3]}...")
     print(f"   🧠 Personality: extroversion={socrates.personality_traits['extroversion']}")
     
+    # One timestamp for everything created in the opening turn
+    t0 = datetime.now()
+    
     # Create forum config
     print("\n2. Setting up forum...")
     config = ForumConfig(
@@ -35,7 +33,7 @@ def interactive_debug():
         description="Interactive debugging session",
         mode=ForumMode.EXPLORATION,
         participants=["socrates"],
-        created_at=datetime.now(),
+        created_at=t0,
         settings={}
     )
     print(f"   ✅ Forum created: {config['name']}")
@@ -50,7 +48,7 @@ def interactive_debug():
         sender="human", 
         content="What is the meaning of life?",
         message_type=MessageType.HUMAN,
-        timestamp=datetime.now(),
+        timestamp=t0,
         thinking=None,
         metadata={}
     )
@@ -68,8 +66,8 @@ def interactive_debug():
         last_speaker="human", 
         waiting_for_human=False,
         session_id="debug-session",
-        created_at=datetime.now(),
-        last_updated=datetime.now()
+        created_at=t0,
+        last_updated=t0
     )
     
     print(f"   ✅ State created with {len(state['messages'])} messages")
@@ -115,22 +113,24 @@ def interactive_debug():
             print("6. Testing follow-up response...")
             
             # Add another human message
+            t1 = datetime.now()
             followup = Message(
                 id="msg-2",
                 sender="human",
                 content="I believe life's meaning comes from happiness and pleasure.",
                 message_type=MessageType.HUMAN, 
-                timestamp=datetime.now(),
+                timestamp=t1,
                 thinking=None,
                 metadata={}
             )
             
-            # Update state
-            new_state = state.copy()
-            new_state["messages"].append(message)
-            new_state["messages"].append(followup)
-            new_state["turn_count"] += 2
-            new_state["last_speaker"] = "human"
+            # Update state without mutating the first turn's message list
+            new_state = {
+                **state,
+                "messages": state["messages"] + [message, followup],
+                "turn_count": state["turn_count"] + 2,
+                "last_speaker": "human",
+            }
             
             print(f"   🧑 Human: {followup['content']}")
             
@@ -2,15 +2,9 @@
 """
 Debug LangGraph flow to understand recursion issue
 """
-import sys
-import os
 from datetime import datetime
 
-# Add project to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from philosopher_dinner.forum.graph import PhilosopherForum
-from philosopher_dinner.forum.state import ForumConfig, ForumMode
+from _bootstrap import PhilosopherForum, ForumConfig, ForumMode
 
 def debug_simple_case():
     """Debug with just one agent to isolate the issue"""
@@ -2,15 +2,10 @@
 """
 Debug the recursion issue
 """
-import sys
-import os
+import uuid
 from datetime import datetime
 
-# Add project to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from philosopher_dinner.forum.graph import PhilosopherForum
-from philosopher_dinner.forum.state import ForumConfig, ForumMode, MessageType
+from _bootstrap import PhilosopherForum, ForumConfig, ForumMode, Message, MessageType
 
 def debug_recursion():
     """Debug why recursion happens"""
@@ -43,6 +38,36 @@ def debug_recursion():
     # Manually step through decision process
     print(f"\n🎯 Decision Process:")
     
+    # agent_id -> (message count when evaluated, activation). The forum's
+    # speaker choice, should_respond() and this loop all evaluate an agent at
+    # the same message count, so each agent is evaluated once per step; the
+    # cache is dropped when the last speaker changes
+    activation_cache = {}
+    cached_speaker = state["last_speaker"]
+    evaluations = 0
+    
+    def cached_evaluator(agent_id, evaluate):
+        def evaluate_activation(state):
+            nonlocal cached_speaker, evaluations
+            if state["last_speaker"] != cached_speaker:
+                activation_cache.clear()
+                cached_speaker = state["last_speaker"]
+            
+            message_count = len(state["messages"])
+            cached = activation_cache.get(agent_id)
+            if cached is not None and cached[0] == message_count:
+                return cached[1]
+            
+            evaluations += 1
+            activation = evaluate(state)
+            activation_cache[agent_id] = (message_count, activation)
+            return activation
+        return evaluate_activation
+    
+    # Shadow each agent's method so the forum's own calls go through the cache
+    for agent_id, agent in forum.agents.items():
+        agent.evaluate_activation = cached_evaluator(agent_id, agent.evaluate_activation)
+    
     for i in range(10):  # Limit iterations
         decision = forum._decide_next_speaker(state)
         print(f"  Step {i+1}: Next speaker = {decision}")
@@ -58,16 +83,13 @@ def debug_recursion():
             agent = forum.agents[decision]
             activation = agent.evaluate_activation(state)
             threshold = 0.3 if len(forum.agents) > 2 else 0.6
-            should_respond = agent.should_respond(state, threshold)
+            should_respond = agent.should_respond(state, threshold, activation)
             
             print(f"    {decision}: activation={activation:.2f}, threshold={threshold}, should_respond={should_respond}")
             
             if should_respond:
                 print(f"    {decision} is responding...")
                 # Add a dummy message to simulate response
-                from philosopher_dinner.forum.state import Message
-                import uuid
-                
                 msg = Message(
                     id=str(uuid.uuid4()),
                     sender=decision,
@@ -91,6 +113,7 @@ def debug_recursion():
     print(f"  Messages: {len(state['messages'])}")
     print(f"  Turn count: {state['turn_count']}")
     print(f"  Agent messages: {sum(1 for m in state['messages'] if m['message_type'] == MessageType.AGENT)}")
+    print(f"  Activation evaluations: {evaluations}")
     
     # Check why it doesn't end
     if state["messages"] and state["messages"][-1]["message_type"] == MessageType.AGENT:
@@ -4,17 +4,11 @@ Demo of the Philosopher Dinner system.
 Shows how Socrates responds to philosophical questions.
 """
 
-import sys
-import os
 from datetime import datetime
 
-# Add project to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from _bootstrap import ForumState, ForumConfig, ForumMode, Message, MessageType, get_socrates
 
-from philosopher_dinner.forum.state import ForumState, ForumConfig, ForumMode, Message, MessageType
-from philosopher_dinner.agents.socrates import SocratesAgent
-
-def demo_conversation():
+def demo_conversation(socrates=None):
     """Demo a conversation with Socrates"""
     
     print("🏛️ PHILOSOPHER DINNER DEMO")
@@ -23,7 +17,11 @@ def demo_conversation():
     print()
     
     # Create Socrates
-    socrates = SocratesAgent()
+    if socrates is None:
+        socrates = get_socrates()
+    
+    # One timestamp for everything created in the opening turn
+    t0 = datetime.now()
     
     # Create forum config
     config = ForumConfig(
@@ -32,7 +30,7 @@ def demo_conversation():
         description="Demo conversation",
         mode=ForumMode.EXPLORATION,
         participants=["socrates"],
-        created_at=datetime.now(),
+        created_at=t0,
         settings={}
     )
     
@@ -42,7 +40,7 @@ def demo_conversation():
         sender="human",
         content="What is justice?",
         message_type=MessageType.HUMAN,
-        timestamp=datetime.now(),
+        timestamp=t0,
         thinking=None,
         metadata={}
     )
@@ -63,8 +61,8 @@ def demo_conversation():
         last_speaker="human",
         waiting_for_human=False,
         session_id="demo-session",
-        created_at=datetime.now(),
-        last_updated=datetime.now()
+        created_at=t0,
+        last_updated=t0
     )
     
     # Let Socrates respond
@@ -107,10 +105,12 @@ def demo_conversation():
             print()
             
             # Update state
-            state["messages"].append(message)
-            state["messages"].append(human_response)
-            state["turn_count"] += 2
-            state["last_speaker"] = "human"
+            state = {
+                **state,
+                "messages": state["messages"] + [message, human_response],
+                "turn_count": state["turn_count"] + 2,
+                "last_speaker": "human",
+            }
             
             # Socrates responds again
             if socrates.should_respond(state):
@@ -47,6 +47,8 @@ AssertionError: Demo test intentionally failed
         test_output=test_output,
         context=context
     )
+    filed, _ = issue_manager.flush_pending_issues()
+    issue_number = issue_number or filed.get(test_name)
     
     if issue_number:
         print(f"✅ Successfully filed issue #{issue_number}")
@@ -86,11 +88,15 @@ AssertionError: Demo test intentionally failed
     
     if issue_number:
         print("🔧 Simulating test fix...")
-        time.sleep(2)  # Simulate fix time
+        # Pause only when a human is watching; CI runs skip the wait
+        if os.environ.get("DEMO_SIMULATE_LATENCY"):
+            time.sleep(2)  # Simulate fix time
         
         # Resolve the bug
         print("✅ Resolving GitHub issue...")
         resolved = issue_manager.resolve_bug_issue(test_name, issue_number)
+        _, closed = issue_manager.flush_pending_issues()
+        resolved = resolved and issue_number in closed
         
         if resolved:
             print(f"✅ Successfully resolved issue #{issue_number}")
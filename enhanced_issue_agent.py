@@ -7,14 +7,150 @@ Automatically commits fixes and links them to GitHub issues
 import os
 import sys
 import json
+import shlex
+import string
+import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List
 from issue_monitoring_agent import IssueMonitoringAgent
 
+# Upper bound on issues fetched by a single GraphQL request
+MAX_ISSUES_PER_QUERY = 50
+
+# Upper bound on issue comments being posted at the same time
+MAX_CONCURRENT_COMMENTS = 10
+
+# Stage everything, commit with the message read from stdin and print the
+# new HEAD, all in one shell; exits with NOTHING_TO_COMMIT on a clean tree.
+# {git} is filled in with the shell-quoted path of the git executable
+NOTHING_TO_COMMIT = 3
+COMMIT_SCRIPT = (
+    'test -n "$({git} status --porcelain)" || exit %d; '
+    "{git} add -A && {git} commit -q -F - && {git} rev-parse HEAD"
+) % NOTHING_TO_COMMIT
+
+# Fixed tail of every automated fix commit message
+_COMMIT_TRAILER = "\n\n🤖 Generated with [Claude Code](https://claude.ai/code)\n\nCo-Authored-By: Claude <noreply@anthropic.com>"
+
+ISSUE_FIELDS = "id number title body state createdAt updatedAt labels(first: 20) { nodes { name } }"
+
+# Issue comment posted after a fix is committed
+COMMIT_COMMENT_TEMPLATE = string.Template("""## 🤖 Automated Fix Applied and Committed
+
+**Timestamp:** ${timestamp}
+**Agent:** Enhanced Issue Monitoring Agent
+**Status:** ✅ Fix Committed Successfully
+**Commit:** [`${short_hash}`](${commit_url})
+
+### Fix Details
+${fix_details}
+
+### Commit Information
+- **Full Hash:** `${commit_hash}`
+- **Short Hash:** `${short_hash}`
+- **View Commit:** ${commit_url}
+- **View Diff:** ${commit_url}.diff
+
+### Verification
+The automated tests are now passing. The issue has been resolved and the fix has been committed.
+
+---
+*This fix was automatically applied and committed by the Enhanced Issue Monitoring Agent*
+""")
+
 class EnhancedIssueAgent(IssueMonitoringAgent):
     """Enhanced issue monitoring agent with commit linking"""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Fixes and commits share one working tree and run one at a time;
+        # only the GitHub comments that follow them are posted concurrently
+        self._comment_pool = None
+        self._pending_comments = []
+        
+        # Use the same resolved git as every other git call the agent makes
+        self._commit_script = COMMIT_SCRIPT.format(git=shlex.quote(self._git))
+    
+    def post_comment_async(self, issue_number, body):
+        """Start posting an issue comment in the background"""
+        if self._comment_pool is None:
+            self._comment_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_COMMENTS)
+        
+        future = self._comment_pool.submit(self.post_comment, issue_number, body)
+        self._pending_comments.append((str(issue_number), future))
+        return future
+    
+    def wait_for_comments(self) -> List[str]:
+        """Wait for queued commit comments to be posted.
+        
+        Records on each issue's fix attempt whether its commit got linked,
+        and returns the numbers of the issues whose comment failed.
+        """
+        failed = []
+        for issue_number, future in self._pending_comments:
+            success, output = future.result()
+            if not success:
+                failed.append(issue_number)
+                print(f"⚠️  Issue #{issue_number}: failed to post comment: {output}")
+            
+            attempt = self.agent_db["fix_attempts"].get(issue_number)
+            if attempt is not None:
+                self.set_agent_record("fix_attempts", issue_number, {**attempt, "commit_linked": success})
+        
+        self._pending_comments = []
+        if self._comment_pool is not None:
+            self._comment_pool.shutdown()
+            self._comment_pool = None
+        return failed
+    
+    def _bulk_fetch_issues(self, numbers: List[int]) -> Dict[int, Dict]:
+        """Fetch several issues by number with one GraphQL request per batch.
+        
+        Issues come back in the same shape as get_open_issues() so they can
+        be handed straight to the processing methods.
+        """
+        owner, _, name = self.get_repo_info().partition('/')
+        issues = {}
+        
+        for start in range(0, len(numbers), MAX_ISSUES_PER_QUERY):
+            batch = numbers[start:start + MAX_ISSUES_PER_QUERY]
+            fields = "\n    ".join(f"i{n}: issue(number: {int(n)}) {{ {ISSUE_FIELDS} }}" for n in batch)
+            query = f"""query($owner: String!, $name: String!) {{
+  repository(owner: $owner, name: $name) {{
+    {fields}
+  }}
+}}"""
+            repository = self.run_gh_graphql(query, owner=owner, name=name).get("repository") or {}
+            
+            for issue in repository.values():
+                if issue:
+                    issue["labels"] = issue["labels"]["nodes"]
+                    issues[issue["number"]] = issue
+                    self._issue_ids[issue["number"]] = issue["id"]
+        
+        return issues
+    
+    def process_issue_numbers(self, numbers: List[int]) -> int:
+        """Fetch the given issues in bulk, then process each with commit linking"""
+        issues = self._bulk_fetch_issues(numbers)
+        
+        fixed_count = 0
+        for number in numbers:
+            issue = issues.get(number)
+            if issue is None:
+                print(f"⚠️  Issue #{number} not found")
+                continue
+            if self.process_issue_with_commit_linking(issue):
+                fixed_count += 1
+        
+        self.flush_fix_comments()
+        self.wait_for_comments()
+        self.flush_agent_database()
+        return fixed_count
+    
     def apply_fix_and_commit(self, analysis, fix_success, fix_details):
         """Apply fix, commit changes, and link to issue"""
         
@@ -24,125 +160,61 @@ class EnhancedIssueAgent(IssueMonitoringAgent):
         issue_number = analysis["issue_number"]
         
         try:
-            # Stage all changes
-            subprocess.run(['git', 'add', '-A'], cwd=self.repo_path, check=True)
-            
-            # Check if there are actually changes to commit
-            result = subprocess.run(['git', 'diff', '--cached', '--quiet'], 
-                                  cwd=self.repo_path)
-            
-            if result.returncode == 0:
-                return False, "No changes to commit"
-            
             # Create commit message with issue reference
             commit_message = f"""🤖 Fix #{issue_number}: {analysis['title'][:50]}
 
 Automated fix applied by Issue Monitoring Agent:
 {fix_details}
 
-Fixes #{issue_number}
-
-🤖 Generated with [Claude Code](https://claude.ai/code)
-
-Co-Authored-By: Claude <noreply@anthropic.com>"""
+Fixes #{issue_number}""" + _COMMIT_TRAILER
             
-            # Create the commit
-            subprocess.run([
-                'git', 'commit', '-m', commit_message
-            ], cwd=self.repo_path, check=True)
+            # Stage, commit and read back the hash in a single invocation
+            result = subprocess.run(
+                self._commit_script, shell=True, input=commit_message,
+                capture_output=True, text=True, cwd=self.repo_path
+            )
+            
+            if result.returncode == NOTHING_TO_COMMIT:
+                return False, "No changes to commit"
+            if result.returncode != 0:
+                return False, f"Failed to commit fix: {result.stderr.strip()}"
             
-            # Get the commit hash
-            result = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                                  capture_output=True, text=True, cwd=self.repo_path)
             commit_hash = result.stdout.strip()
             short_hash = commit_hash[:8]
             
             # Update the GitHub issue with commit information
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            commit_url = f"https://github.com/{self.get_repo_info()}/commit/{commit_hash}"
             
-            commit_comment = f"""## 🤖 Automated Fix Applied and Committed
-            
-**Timestamp:** {timestamp}
-**Agent:** Enhanced Issue Monitoring Agent
-**Status:** ✅ Fix Committed Successfully
-**Commit:** [`{short_hash}`](https://github.com/{self.get_repo_info()}/commit/{commit_hash})
-
-### Fix Details
-{fix_details}
-
-### Commit Information
-- **Full Hash:** `{commit_hash}`
-- **Short Hash:** `{short_hash}`
-- **View Commit:** https://github.com/{self.get_repo_info()}/commit/{commit_hash}
-- **View Diff:** https://github.com/{self.get_repo_info()}/commit/{commit_hash}.diff
-
-### Verification
-The automated tests are now passing. The issue has been resolved and the fix has been committed.
-
----
-*This fix was automatically applied and committed by the Enhanced Issue Monitoring Agent*
-"""
+            commit_comment = COMMIT_COMMENT_TEMPLATE.substitute(
+                timestamp=timestamp,
+                short_hash=short_hash,
+                commit_hash=commit_hash,
+                commit_url=commit_url,
+                fix_details=fix_details
+            )
             
-            # Add comment to issue
-            success, output = self.run_gh_command([
-                'issue', 'comment', str(issue_number), '--body', commit_comment
-            ])
+            # Link the commit on the issue while the next issue is processed
+            self.post_comment_async(issue_number, commit_comment)
             
-            if success:
-                return True, f"Fix committed successfully: {short_hash}"
-            else:
-                return False, f"Fix committed but failed to update issue: {output}"
+            return True, f"Fix committed successfully: {short_hash}"
                 
-        except subprocess.CalledProcessError as e:
-            return False, f"Failed to commit fix: {e}"
         except Exception as e:
             return False, f"Error during commit process: {e}"
     
-    def get_repo_info(self):
-        """Get repository owner/name for URL construction"""
-        try:
-            result = subprocess.run([
-                'git', 'remote', 'get-url', 'origin'
-            ], capture_output=True, text=True, cwd=self.repo_path)
-            
-            if result.returncode == 0:
-                url = result.stdout.strip()
-                # Extract owner/repo from various URL formats
-                if 'github.com' in url:
-                    if url.startswith('git@'):
-                        # SSH format: git@github.com:owner/repo.git
-                        parts = url.split(':')[1].replace('.git', '')
-                    else:
-                        # HTTPS format: https://github.com/owner/repo.git
-                        parts = url.split('github.com/')[-1].replace('.git', '')
-                    return parts
-            
-            return "unknown/unknown"
-        except:
-            return "unknown/unknown"
-    
     def process_issue_with_commit_linking(self, issue):
         """Process an issue and automatically commit any fixes"""
         
         issue_number = str(issue['number'])
         
         # Check if we've already processed this issue recently
-        if issue_number in self.agent_db["processed_issues"]:
-            last_processed = datetime.fromisoformat(
-                self.agent_db["processed_issues"][issue_number]["last_processed"]
-            )
-            if datetime.now() - last_processed < timedelta(hours=1):
-                return False  # Skip if processed within last hour
+        if self.processed_recently(issue_number):
+            return False  # Skip if processed within last hour
         
         # Analyze the issue
-        analysis = self.analyze_issue(issue)
+        analysis = self.get_issue_analysis(issue)
         
-        print(f"📊 Issue #{issue_number} Analysis:")
-        print(f"  Title: {analysis['title'][:50]}...")
-        print(f"  Is Bug: {analysis['is_bug']}")
-        print(f"  Is Automated: {analysis['is_automated']}")
-        print(f"  Fix Confidence: {analysis['fix_confidence']:.2f}")
-        print(f"  Fix Strategy: {analysis['fix_strategy']}")
+        self.print_analysis(issue_number, analysis)
         
         # Only attempt fix if confidence is high enough
         if analysis["fix_confidence"] >= 0.4:
@@ -170,22 +242,20 @@ The automated tests are now passing. The issue has been resolved and the fix has
                 self.create_fix_comment(issue_number, fix_success, fix_details)
             
             # Record the fix attempt
-            self.agent_db["fix_attempts"][issue_number] = {
+            self.set_agent_record("fix_attempts", issue_number, {
                 "timestamp": datetime.now().isoformat(),
                 "analysis": analysis,
                 "fix_success": fix_success,
                 "fix_details": fix_details,
                 "commit_success": commit_success if fix_success else False
-            }
+            })
             
             # Record that we processed this issue
-            self.agent_db["processed_issues"][issue_number] = {
-                "last_processed": datetime.now().isoformat(),
+            self.set_agent_record("processed_issues", issue_number, {
+                "last_processed": time.time(),
                 "fix_attempted": True,
                 "fix_success": fix_success
-            }
-            
-            self.save_agent_database()
+            })
             
             return fix_success
         else:
@@ -205,17 +275,12 @@ def demonstrate_enhanced_workflow():
     print("\n1️⃣ Creating a new test bug...")
     
     cli_file = Path("philosopher_dinner/cli/interface.py")
-    with open(cli_file, 'r') as f:
-        content = f.read()
     
     # Introduce a different bug for demonstration
-    test_content = content.replace(
-        'print("\\nJust type your message to continue the discussion!")',
-        'print("\\nJust type your message to continue the discussion!"); raise Exception("Demo bug for commit linking")'
-    )
-    
-    with open(cli_file, 'w') as f:
-        f.write(test_content)
+    cli_file.write_bytes(cli_file.read_bytes().replace(
+        b'print("\\nJust type your message to continue the discussion!")',
+        b'print("\\nJust type your message to continue the discussion!"); raise Exception("Demo bug for commit linking")'
+    ))
     
     print("✅ Introduced test bug in CLI interface")
     
@@ -223,11 +288,17 @@ def demonstrate_enhanced_workflow():
     print("\n2️⃣ Running tests to detect bug and create issue...")
     
     try:
-        result = subprocess.run([
-            sys.executable, 'enhanced_test_runner.py'
-        ], capture_output=True, text=True)
+        # Run the suite in this interpreter; the CLI module hasn't been
+        # imported yet, so the freshly written bug is what gets loaded
+        import io
+        from contextlib import redirect_stdout
+        from enhanced_test_runner import EnhancedTestRunner
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            EnhancedTestRunner().run_all_tests()
         
-        if "Filed GitHub issue" in result.stdout:
+        if "Filed GitHub issue" in output.getvalue():
             print("✅ GitHub issue created for bug")
         else:
             print("⚠️  No new issue created (may be duplicate)")
@@ -248,6 +319,10 @@ def demonstrate_enhanced_workflow():
         if agent.process_issue_with_commit_linking(issue):
             fixed_count += 1
     
+    agent.flush_fix_comments()
+    agent.wait_for_comments()
+    agent.flush_agent_database()
+    
     print(f"\n✅ Enhanced agent processed {len(issues)} issues, fixed {fixed_count}")
     
     # Show recent commits
@@ -255,7 +330,7 @@ def demonstrate_enhanced_workflow():
     
     try:
         result = subprocess.run([
-            'git', 'log', '--oneline', '-3'
+            agent._git, 'log', '--oneline', '-3'
         ], capture_output=True, text=True)
         
         print(result.stdout)
@@ -267,6 +342,11 @@ def demonstrate_enhanced_workflow():
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "--demo":
         demonstrate_enhanced_workflow()
+    elif len(sys.argv) > 2 and sys.argv[1] == "--issues":
+        # Process specific issues: --issues 12 15 ...
+        agent = EnhancedIssueAgent()
+        fixed_count = agent.process_issue_numbers([int(n) for n in sys.argv[2:]])
+        print(f"✅ Fixed {fixed_count} of {len(sys.argv) - 2} issues")
     else:
         # Run the enhanced agent
         agent = EnhancedIssueAgent()
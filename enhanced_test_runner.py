@@ -6,8 +6,11 @@ Automatically files issues for bugs and resolves them when fixed.
 
 import sys
 import os
+import io
 import traceback
 import json
+import importlib
+import concurrent.futures
 from datetime import datetime
 from typing import Dict, List, Tuple
 
@@ -15,11 +18,67 @@ from typing import Dict, List, Tuple
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
 from github_issue_manager import GitHubIssueManager
-from tests.test_runner_simple import (
-    test_help_command, test_langgraph_integration, 
-    test_socrates_authenticity, test_full_conversation_flow,
-    test_goodbye_functionality
+
+# (test_name, "module:function") for every tracked test; the test modules
+# are only imported when a test is first run
+TESTS = (
+    ("test_help_command", "tests.test_runner_simple:test_help_command"),
+    ("test_langgraph_integration", "tests.test_runner_simple:test_langgraph_integration"),
+    ("test_socrates_authenticity", "tests.test_runner_simple:test_socrates_authenticity"),
+    ("test_full_conversation_flow", "tests.test_runner_simple:test_full_conversation_flow"),
+    ("test_goodbye_functionality", "tests.test_runner_simple:test_goodbye_functionality"),
 )
+TEST_ADDRESSES = dict(TESTS)
+
+_resolved_tests = {}
+
+
+def _resolve(test_name: str):
+    """Import and return the test function registered under test_name"""
+    test_func = _resolved_tests.get(test_name)
+    if test_func is None:
+        module_name, _, attr = TEST_ADDRESSES[test_name].partition(":")
+        test_func = getattr(importlib.import_module(module_name), attr)
+        _resolved_tests[test_name] = test_func
+    return test_func
+
+
+def _run_one(test_name: str, tracked_bug_ids=frozenset()) -> Tuple[str, bool, str, str, str]:
+    """Run one test from TESTS with its output captured.
+    
+    Module-level so it can be sent to a worker process. Returns
+    (test_name, success, stdout, stderr, traceback_str); on failure stderr
+    holds the error message. The traceback is left empty for failures that
+    already have a tracked bug, since no issue will be filed for them.
+    """
+    from contextlib import redirect_stdout, redirect_stderr
+    
+    stdout_capture = io.StringIO()
+    stderr_capture = io.StringIO()
+    
+    try:
+        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+            _resolve(test_name)()
+    except Exception as e:
+        error_message = str(e)
+        if GitHubIssueManager.make_bug_id(test_name, error_message) in tracked_bug_ids:
+            return test_name, False, "", error_message, ""
+        return test_name, False, "", error_message, traceback.format_exc()
+    
+    return test_name, True, stdout_capture.getvalue(), stderr_capture.getvalue(), ""
+
+
+def _run_silent(test_name: str) -> bool:
+    """Run a test for its pass/fail status only, discarding its output"""
+    from contextlib import redirect_stdout, redirect_stderr
+    
+    try:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull), redirect_stderr(devnull):
+            _resolve(test_name)()
+    except Exception:
+        return False
+    return True
+
 
 class EnhancedTestRunner:
     """Enhanced test runner with GitHub issue integration"""
@@ -28,50 +87,34 @@ class EnhancedTestRunner:
         self.issue_manager = GitHubIssueManager()
         self.test_results = {}
         
-    def run_test_with_issue_tracking(self, test_func, test_name: str) -> Tuple[bool, str, str]:
-        """Run a test and track issues if it fails"""
+    def run_test_with_issue_tracking(self, test_name: str) -> Tuple[bool, str, str]:
+        """Run a test in this process and track issues if it fails"""
+        tracked_bug_ids = frozenset(self.issue_manager.bug_db["tracked_bugs"])
+        return self.track_test_result(*_run_one(test_name, tracked_bug_ids))
+    
+    def track_test_result(self, test_name: str, success: bool, stdout: str,
+                          stderr: str, traceback_str: str) -> Tuple[bool, str, str]:
+        """Update the bug database from a _run_one result"""
         
-        try:
-            # Capture stdout/stderr during test execution
-            import io
-            from contextlib import redirect_stdout, redirect_stderr
-            
-            stdout_capture = io.StringIO()
-            stderr_capture = io.StringIO()
-            
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                test_func()
-            
-            # Test passed
-            stdout_content = stdout_capture.getvalue()
-            stderr_content = stderr_capture.getvalue()
-            
-            # Check if this test was previously failing and is now passing
-            self.issue_manager.check_resolved_bugs({test_name: {"status": "passed"}})
-            
-            return True, stdout_content, stderr_content
-            
-        except Exception as e:
-            # Test failed
-            error_message = str(e)
-            traceback_str = traceback.format_exc()
-            
-            # File a GitHub issue for this bug
-            context = {
-                "test_function": test_func.__name__,
-                "test_module": test_func.__module__,
-                "timestamp": datetime.now().isoformat(),
-                "traceback": traceback_str
-            }
-            
-            self.issue_manager.create_bug_issue(
-                test_name=test_name,
-                error_message=error_message,
-                test_output=traceback_str,
-                context=context
-            )
-            
-            return False, "", error_message
+        if success:
+            return True, stdout, stderr
+        
+        # File a GitHub issue for this bug
+        context = {
+            "test_function": test_name,
+            "test_module": TEST_ADDRESSES[test_name].partition(":")[0],
+            "timestamp": datetime.now().isoformat(),
+            "traceback": traceback_str
+        }
+        
+        self.issue_manager.create_bug_issue(
+            test_name=test_name,
+            error_message=stderr,
+            test_output=traceback_str,
+            context=context
+        )
+        
+        return False, "", stderr
     
     def run_all_tests(self) -> Dict:
         """Run all tests with GitHub issue tracking"""
@@ -81,14 +124,6 @@ class EnhancedTestRunner:
         print("Testing with GitHub issue tracking...")
         print("=" * 60)
         
-        tests = [
-            (test_help_command, "test_help_command"),
-            (test_langgraph_integration, "test_langgraph_integration"),
-            (test_socrates_authenticity, "test_socrates_authenticity"),
-            (test_full_conversation_flow, "test_full_conversation_flow"),
-            (test_goodbye_functionality, "test_goodbye_functionality")
-        ]
-        
         results = {
             "passed": 0,
             "failed": 0,
@@ -96,13 +131,27 @@ class EnhancedTestRunner:
             "errors": []
         }
         
-        for test_func, test_name in tests:
-            print(f"\n🔧 Running {test_name}...")
+        # Tests run concurrently in worker processes; their results are
+        # recorded here one at a time so the bug database stays consistent
+        workers = min(len(TESTS), max(1, (os.cpu_count() or 1) - 2))
+        outcomes = {}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            tracked_bug_ids = frozenset(self.issue_manager.bug_db["tracked_bugs"])
+            futures = [executor.submit(_run_one, test_name, tracked_bug_ids) for test_name, _ in TESTS]
+            for future in concurrent.futures.as_completed(futures):
+                outcome = future.result()
+                outcomes[outcome[0]] = outcome
+        
+        # The per-test lines and summary are collected and written in one go
+        report = io.StringIO()
+        
+        for test_name, _ in TESTS:
+            print(f"\n🔧 Running {test_name}...", file=report)
             
-            success, stdout, stderr = self.run_test_with_issue_tracking(test_func, test_name)
+            success, stdout, stderr = self.track_test_result(*outcomes[test_name])
             
             if success:
-                print(f"  ✅ {test_name} passed")
+                print(f"  ✅ {test_name} passed", file=report)
                 results["passed"] += 1
                 results["tests"][test_name] = {
                     "status": "passed",
@@ -110,7 +159,7 @@ class EnhancedTestRunner:
                     "stderr": stderr
                 }
             else:
-                print(f"  ❌ {test_name} failed: {stderr}")
+                print(f"  ❌ {test_name} failed: {stderr}", file=report)
                 results["failed"] += 1
                 results["tests"][test_name] = {
                     "status": "failed",
@@ -119,26 +168,36 @@ class EnhancedTestRunner:
                 }
                 results["errors"].append(f"{test_name}: {stderr}")
         
+        # Resolve bugs whose tests now pass, then file and close this run's
+        # issues in one GitHub request
+        self.test_results = results["tests"]
+        self.issue_manager.check_resolved_bugs(self.test_results)
+        self.issue_manager.flush_pending_issues()
+        self.issue_manager.flush_bug_database()
+        
         # Show results
-        print(f"\n📊 TEST RESULTS:")
-        print(f"  ✅ Passed: {results['passed']}")
-        print(f"  ❌ Failed: {results['failed']}")
+        print(f"\n📊 TEST RESULTS:", file=report)
+        print(f"  ✅ Passed: {results['passed']}", file=report)
+        print(f"  ❌ Failed: {results['failed']}", file=report)
         
         # Show bug statistics
         stats = self.issue_manager.get_bug_statistics()
-        print(f"\n📊 BUG TRACKING STATISTICS:")
-        print(f"  🐛 Total bugs found: {stats['total_bugs_found']}")
-        print(f"  📋 Currently tracked: {stats['currently_tracked']}")
-        print(f"  ✅ Resolved bugs: {stats['resolved_bugs']}")
-        print(f"  📈 Resolution rate: {stats['resolution_rate']:.2%}")
+        print(f"\n📊 BUG TRACKING STATISTICS:", file=report)
+        print(f"  🐛 Total bugs found: {stats['total_bugs_found']}", file=report)
+        print(f"  📋 Currently tracked: {stats['currently_tracked']}", file=report)
+        print(f"  ✅ Resolved bugs: {stats['resolved_bugs']}", file=report)
+        print(f"  📈 Resolution rate: {stats['resolution_rate']:.2%}", file=report)
         
         if results["errors"]:
-            print(f"\n🐛 ERRORS (GitHub issues created):")
+            print(f"\n🐛 ERRORS (GitHub issues created):", file=report)
             for error in results["errors"]:
-                print(f"  • {error}")
+                print(f"  • {error}", file=report)
         else:
-            print(f"\n🎉 ALL TESTS PASSED!")
-            print("  System is working correctly!")
+            print(f"\n🎉 ALL TESTS PASSED!", file=report)
+            print("  System is working correctly!", file=report)
+        
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
         
         return results
     
@@ -146,24 +205,20 @@ class EnhancedTestRunner:
         """Check if any previously tracked bugs are now resolved"""
         print("\n🔍 Checking for resolved bugs...")
         
-        # Run tests to get current status
-        test_results = {}
-        tests = [
-            (test_help_command, "test_help_command"),
-            (test_langgraph_integration, "test_langgraph_integration"),
-            (test_socrates_authenticity, "test_socrates_authenticity"),
-            (test_full_conversation_flow, "test_full_conversation_flow")
-        ]
-        
-        for test_func, test_name in tests:
-            try:
-                test_func()
-                test_results[test_name] = {"status": "passed"}
-            except Exception:
-                test_results[test_name] = {"status": "failed"}
+        # Reuse this runner's results when run_all_tests already ran;
+        # otherwise only tests with a tracked bug need re-running
+        test_results = dict(self.test_results)
+        tracked_names = {bug["test_name"] for bug in self.issue_manager.list_tracked_bugs()}
+        for test_name, _ in TESTS:
+            if test_name not in tracked_names or test_name in test_results:
+                continue
+            passed = _run_silent(test_name)
+            test_results[test_name] = {"status": "passed" if passed else "failed"}
         
         # Check for resolved bugs
-        resolved_issues = self.issue_manager.check_resolved_bugs(test_results)
+        self.issue_manager.check_resolved_bugs(test_results)
+        _, resolved_issues = self.issue_manager.flush_pending_issues()
+        self.issue_manager.flush_bug_database()
         
         if resolved_issues:
             print(f"✅ Resolved {len(resolved_issues)} GitHub issues:")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Direct GitHub API access shared by the issue manager and the issue agents.
+Requests go over keep-alive HTTPS connections instead of a `gh` process each.
+"""
+
+import os
+import json
+import threading
+import http.client
+from typing import Callable, Dict, List, Optional, Tuple
+
+GITHUB_API_HOST = "api.github.com"
+
+
+def find_token(run_gh_command: Callable[[List[str]], Tuple[bool, str]]) -> Optional[str]:
+    """The GitHub token from the environment or, failing that, from gh.
+    Checked in the same order gh itself uses.
+    """
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+    
+    success, output = run_gh_command(['auth', 'token'])
+    return output if success and output else None
+
+
+class GitHubAPI:
+    """Authenticated GitHub API calls, over one persistent connection per thread"""
+    
+    def __init__(self, token: str, user_agent: str):
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": user_agent,
+        }
+        self._local = threading.local()
+        
+        # Every connection opened, so close() can reach other threads' too
+        self._conns = []
+        self._conns_lock = threading.Lock()
+    
+    def request(self, method: str, path: str, payload: Dict = None) -> Tuple[bool, str]:
+        """Send a request and return (success, response body)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(GITHUB_API_HOST, timeout=30)
+            self._local.conn = conn
+            with self._conns_lock:
+                self._conns.append(conn)
+        
+        headers = dict(self._headers)
+        body = None
+        if payload is not None:
+            body = json.dumps(payload)
+            headers["Content-Type"] = "application/json"
+        
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read().decode()
+        except (http.client.HTTPException, OSError) as e:
+            # Drop the broken connection; the next call opens a fresh one
+            conn.close()
+            self._local.conn = None
+            with self._conns_lock:
+                if conn in self._conns:
+                    self._conns.remove(conn)
+            return False, str(e)
+        
+        return 200 <= response.status < 300, data
+    
+    def close(self):
+        """Close every open connection"""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
@@ -6,11 +6,91 @@ Automatically files issues when bugs are found and resolves them when fixed.
 
 import os
 import json
+import atexit
+import hashlib
+import functools
+import re
+import string
 import subprocess
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import github_api
+
+# Use orjson for the bug database when it's installed, json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Labels applied to automatically filed issues
+ISSUE_LABELS = ("bug", "automated")
+
+# Body of an automatically filed bug issue
+BUG_ISSUE_TEMPLATE = string.Template("""## 🐛 Automated Bug Report
+        
+**Test:** `${test_name}`
+**Discovered:** ${timestamp}
+**Bug ID:** `${bug_id}`
+
+### Error Message
+```
+${error_message}
+```
+
+### Test Output
+```
+${test_output}
+```
+
+### Context
+${context}
+
+### Reproduction Steps
+1. Run the test suite: `python3 autotest.py --quick`
+2. The test `${test_name}` should fail with the above error
+
+### Expected Behavior
+The test should pass without errors.
+
+### Environment
+- Python: ${python_version}
+- Platform: ${platform}
+- Working Directory: ${cwd}
+
+---
+*This issue was automatically created by the CI system when a test failed.*
+*Tag: `automated-bug-report`*
+""")
+
+# Comment posted when a bug's test passes again and its issue is closed
+RESOLUTION_COMMENT_TEMPLATE = string.Template("""## 🎉 Bug Resolved
+        
+**Test:** `${test_name}`
+**Resolved:** ${timestamp}
+**Bug ID:** `${bug_id}`
+**Resolution Commit:** `${short_commit}`
+
+### Resolution
+The test `${test_name}` is now passing. The bug has been automatically resolved.
+
+### Related Commits
+This issue was resolved around commit [`${short_commit}`](https://github.com/${repo}/commit/${commit}).
+
+### Verification
+Run the test suite to verify the fix:
+```bash
+python3 autotest.py --quick
+```
+
+---
+*This issue was automatically resolved by the CI system when the test started passing.*
+""")
+
+# Bug ids from before stable hashing ended in hash(error_message) % 10000
+LEGACY_BUG_ID = re.compile(r"test-.+-\d{1,4}")
 
 class GitHubIssueManager:
     """Manages GitHub issues for automated bug tracking and resolution"""
@@ -18,30 +98,110 @@ class GitHubIssueManager:
     def __init__(self, repo_path: str = "."):
         self.repo_path = Path(repo_path)
         self.bug_db_path = self.repo_path / "bug_tracking.json"
+        
+        # Environment details quoted in every issue body; fixed for the process
+        self._env = {
+            "python_version": sys.version,
+            "platform": sys.platform,
+            "cwd": os.getcwd()
+        }
+        
+        # Database changes are written once per batch by flush_bug_database(),
+        # and on exit if a batch was left unflushed
+        self._db_dirty = False
+        atexit.register(self.flush_bug_database)
+        
         self.load_bug_database()
+        
+        # Issue creations and closures are queued and sent to GitHub together
+        # by flush_pending_issues()
+        self._pending_create = {}
+        self._pending_close = {}
+        
+        # Bug ids by (test_name, error_message), for repeatedly failing tests
+        self._bug_id_cache = {}
+        
+        # The origin remote doesn't change during a run, so look it up once
+        self._repo_info = None
+        self._head_sha = None
+    
+    @functools.cached_property
+    def _api_token(self) -> Optional[str]:
+        """The GitHub token, looked up on first use"""
+        return github_api.find_token(self.run_gh_command)
+    
+    @functools.cached_property
+    def _api_client(self) -> github_api.GitHubAPI:
+        """With a token, GraphQL requests go straight to the API over a
+        keep-alive connection instead of a `gh` process each"""
+        return github_api.GitHubAPI(self._api_token, "philosopher-dinner-issue-manager")
     
     def load_bug_database(self):
         """Load the bug tracking database"""
         if self.bug_db_path.exists():
             try:
-                with open(self.bug_db_path, 'r') as f:
-                    self.bug_db = json.load(f)
+                if orjson is not None:
+                    with open(self.bug_db_path, 'rb') as f:
+                        self.bug_db = orjson.loads(f.read())
+                else:
+                    with open(self.bug_db_path, 'r') as f:
+                        self.bug_db = json.load(f)
             except (json.JSONDecodeError, FileNotFoundError):
                 self.bug_db = {"tracked_bugs": {}, "resolved_bugs": {}}
         else:
             self.bug_db = {"tracked_bugs": {}, "resolved_bugs": {}}
+        
+        # Re-key bugs filed under the old per-process hash() ids
+        for section in ("tracked_bugs", "resolved_bugs"):
+            bugs = self.bug_db[section]
+            for old_id in [bid for bid in bugs if LEGACY_BUG_ID.fullmatch(bid)]:
+                bug_info = bugs.pop(old_id)
+                bugs[self.make_bug_id(bug_info["test_name"], bug_info["error_message"])] = bug_info
+                self._db_dirty = True
+        
+        # Index of tracked bug ids by test name, kept in sync with tracked_bugs
+        self._by_test_name = defaultdict(list)
+        for bug_id, bug_info in self.bug_db["tracked_bugs"].items():
+            self._by_test_name[bug_info["test_name"]].append(bug_id)
+        
+        # Running counts for get_bug_statistics(), updated alongside the
+        # tracked/resolved sections
+        self._n_tracked = len(self.bug_db["tracked_bugs"])
+        self._n_resolved = len(self.bug_db["resolved_bugs"])
+        self._n_total = self._n_tracked + self._n_resolved
+    
+    @staticmethod
+    def make_bug_id(test_name: str, error_message: str) -> str:
+        """Build a bug id that is stable across runs for the same failure"""
+        digest = hashlib.blake2b(error_message.encode("utf-8"), digest_size=8).hexdigest()
+        return f"test-{test_name}-{digest}"
     
     def save_bug_database(self):
         """Save the bug tracking database"""
-        with open(self.bug_db_path, 'w') as f:
-            json.dump(self.bug_db, f, indent=2)
+        # Write a temp file and rename it over the database so an interrupted
+        # write never leaves a truncated file behind
+        tmp_path = self.bug_db_path.with_name(self.bug_db_path.name + ".tmp")
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(self.bug_db, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(self.bug_db, f, indent=2)
+        os.replace(tmp_path, self.bug_db_path)
+    
+    def flush_bug_database(self):
+        """Write the bug database if it has unsaved changes"""
+        if self._db_dirty:
+            self.save_bug_database()
+            self._db_dirty = False
     
-    def run_gh_command(self, args: List[str]) -> Tuple[bool, str]:
+    def run_gh_command(self, args: List[str], input: str = None) -> Tuple[bool, str]:
         """Run a GitHub CLI command"""
         try:
             result = subprocess.run(
                 ['gh'] + args,
                 cwd=self.repo_path,
+                input=input,
                 capture_output=True,
                 text=True
             )
@@ -51,12 +211,19 @@ class GitHubIssueManager:
         except Exception as e:
             return False, str(e)
     
+    def _api(self, method: str, path: str, payload: Dict = None) -> Tuple[bool, str]:
+        """Call the GitHub API on the manager's persistent connection"""
+        return self._api_client.request(method, path, payload)
+    
     def create_bug_issue(self, test_name: str, error_message: str, 
                         test_output: str, context: Dict = None) -> Optional[str]:
         """Create a GitHub issue for a discovered bug"""
         
         # Create a unique bug identifier
-        bug_id = f"test-{test_name}-{hash(error_message) % 10000}"
+        key = (test_name, error_message)
+        bug_id = self._bug_id_cache.get(key)
+        if bug_id is None:
+            bug_id = self._bug_id_cache[key] = self.make_bug_id(test_name, error_message)
         
         # Check if we've already filed this bug
         if bug_id in self.bug_db["tracked_bugs"]:
@@ -64,170 +231,253 @@ class GitHubIssueManager:
             print(f"🔍 Bug already tracked: Issue #{existing_issue['issue_number']}")
             return existing_issue["issue_number"]
         
+        if bug_id in self._pending_create:
+            return None
+        
         # Create issue title and body
         title = f"🐛 [AUTO] Bug in {test_name}: {error_message[:50]}..."
         
-        body = f"""## 🐛 Automated Bug Report
-        
-**Test:** `{test_name}`
-**Discovered:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Bug ID:** `{bug_id}`
-
-### Error Message
-```
-{error_message}
-```
-
-### Test Output
-```
-{test_output}
-```
-
-### Context
-{json.dumps(context or {}, indent=2)}
-
-### Reproduction Steps
-1. Run the test suite: `python3 autotest.py --quick`
-2. The test `{test_name}` should fail with the above error
-
-### Expected Behavior
-The test should pass without errors.
-
-### Environment
-- Python: {sys.version}
-- Platform: {sys.platform}
-- Working Directory: {os.getcwd()}
-
----
-*This issue was automatically created by the CI system when a test failed.*
-*Tag: `automated-bug-report`*
-"""
+        body = BUG_ISSUE_TEMPLATE.substitute(
+            self._env,
+            test_name=test_name,
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            bug_id=bug_id,
+            error_message=error_message,
+            test_output=test_output,
+            context=json.dumps(context or {}, indent=2)
+        )
         
-        # Create the GitHub issue
-        success, output = self.run_gh_command([
-            'issue', 'create',
-            '--title', title,
-            '--body', body,
-            '--label', 'bug,automated'
-        ])
-        
-        if success:
-            # Extract issue number from output
-            issue_number = output.split('/')[-1] if '/' in output else output
-            
-            # Track the bug in our database
-            self.bug_db["tracked_bugs"][bug_id] = {
-                "issue_number": issue_number,
-                "test_name": test_name,
-                "error_message": error_message,
-                "created_at": datetime.now().isoformat(),
-                "status": "open"
-            }
-            
-            self.save_bug_database()
-            print(f"✅ Filed GitHub issue #{issue_number} for bug: {error_message[:50]}...")
-            return issue_number
-        else:
-            print(f"❌ Failed to create GitHub issue: {output}")
-            return None
+        # Queue the GitHub issue; it is filed by flush_pending_issues()
+        self._pending_create[bug_id] = {
+            "title": title,
+            "body": body,
+            "test_name": test_name,
+            "error_message": error_message
+        }
+        print(f"📝 Queued GitHub issue for bug: {error_message[:50]}...")
+        return None
     
-    def resolve_bug_issue(self, test_name: str, issue_number: str = None) -> bool:
+    def resolve_bug_issue(self, test_name: str, issue_number: str = None,
+                          head_sha: str = None) -> bool:
         """Resolve a bug issue when the test passes"""
         
         # Find the bug by test name
         bug_to_resolve = None
         bug_id = None
         
-        for bid, bug_info in self.bug_db["tracked_bugs"].items():
-            if bug_info["test_name"] == test_name:
-                if issue_number is None or bug_info["issue_number"] == issue_number:
-                    bug_to_resolve = bug_info
-                    bug_id = bid
-                    break
+        for bid in self._by_test_name.get(test_name, ()):
+            if bid in self._pending_close:
+                continue
+            bug_info = self.bug_db["tracked_bugs"][bid]
+            if issue_number is None or bug_info["issue_number"] == issue_number:
+                bug_to_resolve = bug_info
+                bug_id = bid
+                break
         
         if not bug_to_resolve:
             return False
         
         # Get current commit for linking
-        try:
-            import subprocess
-            result = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                                  capture_output=True, text=True)
-            current_commit = result.stdout.strip()
-            short_commit = current_commit[:8] if result.returncode == 0 else "unknown"
-        except:
-            current_commit = "unknown"
-            short_commit = "unknown"
+        current_commit = head_sha or self._get_head_sha()
+        short_commit = current_commit[:8]
         
         # Close the GitHub issue
-        close_message = f"""## 🎉 Bug Resolved
+        close_message = RESOLUTION_COMMENT_TEMPLATE.substitute(
+            test_name=test_name,
+            timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            bug_id=bug_id,
+            short_commit=short_commit,
+            repo=self.get_repo_info(),
+            commit=current_commit
+        )
         
-**Test:** `{test_name}`
-**Resolved:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-**Bug ID:** `{bug_id}`
-**Resolution Commit:** `{short_commit}`
-
-### Resolution
-The test `{test_name}` is now passing. The bug has been automatically resolved.
-
-### Related Commits
-This issue was resolved around commit [`{short_commit}`](https://github.com/{self.get_repo_info()}/commit/{current_commit}).
-
-### Verification
-Run the test suite to verify the fix:
-```bash
-python3 autotest.py --quick
-```
-
----
-*This issue was automatically resolved by the CI system when the test started passing.*
-"""
+        # Queue the closure; it is sent by flush_pending_issues()
+        self._pending_close[bug_id] = close_message
+        return True
+    
+    def flush_pending_issues(self) -> Tuple[Dict[str, str], List[str]]:
+        """File and close all queued issues with a single GraphQL mutation.
         
-        success, output = self.run_gh_command([
-            'issue', 'close', bug_to_resolve["issue_number"],
-            '--comment', close_message
-        ])
+        Returns ({test_name: issue_number} for filed issues, [closed issue
+        numbers]).
+        """
+        filed, closed = {}, []
+        if not self._pending_create and not self._pending_close:
+            return filed, closed
         
-        if success:
+        pending_create, self._pending_create = self._pending_create, {}
+        pending_close, self._pending_close = self._pending_close, {}
+        
+        # Node ids for the repository, its labels and the issues to close
+        owner, _, name = self.get_repo_info().partition('/')
+        close_numbers = {
+            bug_id: self.bug_db["tracked_bugs"][bug_id]["issue_number"]
+            for bug_id in pending_close
+        }
+        issue_fields = " ".join(
+            f"i{i}: issue(number: {int(number)}) {{ id }}"
+            for i, number in enumerate(close_numbers.values())
+        )
+        lookup = self._run_graphql(
+            "query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) "
+            f"{{ id labels(first: 100) {{ nodes {{ id name }} }} {issue_fields} }} }}",
+            {"owner": owner, "name": name}
+        )
+        repository = (lookup or {}).get("repository")
+        if not repository:
+            # Put everything back so the next flush retries it
+            print("❌ Failed to look up repository for queued GitHub issues")
+            self._requeue(pending_create, pending_close)
+            return filed, closed
+        label_ids = [
+            label["id"] for label in repository["labels"]["nodes"]
+            if label["name"] in ISSUE_LABELS
+        ]
+        
+        # One aliased field per operation, each with its own input variable
+        declarations, fields, variables = [], [], {}
+        for i, (bug_id, issue) in enumerate(pending_create.items()):
+            declarations.append(f"$c{i}: CreateIssueInput!")
+            fields.append(f"c{i}: createIssue(input: $c{i}) {{ issue {{ number }} }}")
+            variables[f"c{i}"] = {
+                "repositoryId": repository["id"],
+                "title": issue["title"],
+                "body": issue["body"],
+                "labelIds": label_ids
+            }
+        missing = set()
+        for i, (bug_id, close_message) in enumerate(pending_close.items()):
+            if not repository.get(f"i{i}"):
+                # Deleted or transferred, so there is no issue left to close
+                missing.add(bug_id)
+                continue
+            issue_id = repository[f"i{i}"]["id"]
+            declarations += [f"$a{i}: AddCommentInput!", f"$k{i}: CloseIssueInput!"]
+            fields += [
+                f"a{i}: addComment(input: $a{i}) {{ clientMutationId }}",
+                f"k{i}: closeIssue(input: $k{i}) {{ issue {{ number }} }}"
+            ]
+            variables[f"a{i}"] = {"subjectId": issue_id, "body": close_message}
+            variables[f"k{i}"] = {"issueId": issue_id}
+        
+        data = {}
+        if fields:
+            data = self._run_graphql(
+                f"mutation({', '.join(declarations)}) {{ {' '.join(fields)} }}",
+                variables
+            ) or {}
+        
+        now = datetime.now().isoformat()
+        failed_create, failed_close = {}, {}
+        for i, (bug_id, issue) in enumerate(pending_create.items()):
+            result = data.get(f"c{i}")
+            if not result:
+                print(f"❌ Failed to create GitHub issue for bug: {issue['error_message'][:50]}...")
+                failed_create[bug_id] = issue
+                continue
+            issue_number = str(result["issue"]["number"])
+            
+            # Track the bug in our database
+            self.bug_db["tracked_bugs"][bug_id] = {
+                "issue_number": issue_number,
+                "test_name": issue["test_name"],
+                "error_message": issue["error_message"],
+                "created_at": now,
+                "status": "open"
+            }
+            self._by_test_name[issue["test_name"]].append(bug_id)
+            self._n_tracked += 1
+            self._n_total += 1
+            filed[issue["test_name"]] = issue_number
+            print(f"✅ Filed GitHub issue #{issue_number} for bug: {issue['error_message'][:50]}...")
+        
+        for i, (bug_id, close_message) in enumerate(pending_close.items()):
+            bug_info = self.bug_db["tracked_bugs"][bug_id]
+            if bug_id in missing:
+                print(f"⚠️  GitHub issue #{bug_info['issue_number']} no longer exists; resolving bug for test {bug_info['test_name']} locally")
+                status = "resolved_issue_missing"
+            elif not data.get(f"k{i}"):
+                print(f"❌ Failed to close GitHub issue #{bug_info['issue_number']}")
+                failed_close[bug_id] = close_message
+                continue
+            else:
+                status = "resolved"
+            
             # Move bug to resolved database
             self.bug_db["resolved_bugs"][bug_id] = {
-                **bug_to_resolve,
-                "resolved_at": datetime.now().isoformat(),
-                "status": "resolved"
+                **bug_info,
+                "resolved_at": now,
+                "status": status
             }
             
             # Remove from tracked bugs
             del self.bug_db["tracked_bugs"][bug_id]
-            
-            self.save_bug_database()
-            print(f"✅ Resolved GitHub issue #{bug_to_resolve['issue_number']} for test: {test_name}")
-            return True
+            self._by_test_name[bug_info["test_name"]].remove(bug_id)
+            self._n_tracked -= 1
+            self._n_resolved += 1
+            if bug_id in missing:
+                continue
+            closed.append(bug_info["issue_number"])
+            print(f"✅ Resolved GitHub issue #{bug_info['issue_number']} for test: {bug_info['test_name']}")
+        
+        self._requeue(failed_create, failed_close)
+        if filed or closed or missing:
+            self._db_dirty = True
+        return filed, closed
+    
+    def _requeue(self, pending_create: Dict, pending_close: Dict):
+        """Return unsent creations and closures to the queues, ahead of
+        anything queued since the flush began"""
+        self._pending_create = {**pending_create, **self._pending_create}
+        self._pending_close = {**pending_close, **self._pending_close}
+    
+    def _run_graphql(self, query: str, variables: Dict) -> Optional[Dict]:
+        """Run a GraphQL request and return its data.
+        
+        Uses the API connection when a token is available and `gh api
+        graphql` (with the body on stdin) otherwise. Partial data is
+        returned even when some fields failed.
+        """
+        request = {"query": query, "variables": variables}
+        if self._api_token:
+            success, output = self._api('POST', '/graphql', request)
         else:
-            print(f"❌ Failed to close GitHub issue: {output}")
-            return False
+            success, output = self.run_gh_command(
+                ['api', 'graphql', '--input', '-'], input=json.dumps(request)
+            )
+        try:
+            return json.loads(output).get("data")
+        except (json.JSONDecodeError, AttributeError):
+            if not success:
+                print(f"❌ GitHub GraphQL request failed: {output}")
+            return None
     
     def check_resolved_bugs(self, test_results: Dict) -> List[str]:
         """Check if any previously failing tests are now passing"""
         resolved_issues = []
         
-        for bug_id, bug_info in list(self.bug_db["tracked_bugs"].items()):
-            test_name = bug_info["test_name"]
-            
-            # Check if the test is now passing
-            if test_results.get(test_name, {}).get("status") == "passed":
-                issue_number = self.resolve_bug_issue(test_name)
-                if issue_number:
-                    resolved_issues.append(bug_info["issue_number"])
+        # Only tests that now pass and have tracked bugs need resolving
+        passing = {name for name, result in test_results.items() if result.get("status") == "passed"}
+        test_names = [name for name in passing & self._by_test_name.keys() if self._by_test_name[name]]
+        if not test_names:
+            return resolved_issues
+        
+        head_sha = self._get_head_sha()
+        for test_name in test_names:
+            for bug_id in list(self._by_test_name[test_name]):
+                issue_number = self.bug_db["tracked_bugs"][bug_id]["issue_number"]
+                if self.resolve_bug_issue(test_name, issue_number, head_sha=head_sha):
+                    resolved_issues.append(issue_number)
         
         return resolved_issues
     
     def get_bug_statistics(self) -> Dict:
         """Get statistics about tracked and resolved bugs"""
         return {
-            "total_bugs_found": len(self.bug_db["tracked_bugs"]) + len(self.bug_db["resolved_bugs"]),
-            "currently_tracked": len(self.bug_db["tracked_bugs"]),
-            "resolved_bugs": len(self.bug_db["resolved_bugs"]),
-            "resolution_rate": len(self.bug_db["resolved_bugs"]) / max(1, len(self.bug_db["tracked_bugs"]) + len(self.bug_db["resolved_bugs"]))
+            "total_bugs_found": self._n_total,
+            "currently_tracked": self._n_tracked,
+            "resolved_bugs": self._n_resolved,
+            "resolution_rate": self._n_resolved / max(1, self._n_total)
         }
     
     def list_tracked_bugs(self) -> List[Dict]:
@@ -238,13 +488,53 @@ python3 autotest.py --quick
         """List all resolved bugs"""
         return list(self.bug_db["resolved_bugs"].values())
     
+    def _get_head_sha(self) -> str:
+        """Get the HEAD commit hash, read once per manager"""
+        if self._head_sha is None:
+            self._head_sha = self._read_head_sha() or "unknown"
+        return self._head_sha
+    
+    def _read_head_sha(self) -> Optional[str]:
+        """Resolve HEAD from the files under .git, falling back to git rev-parse"""
+        git_dir = self.repo_path / ".git"
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+            if not head.startswith("ref: "):
+                # Detached HEAD holds the hash itself
+                return head
+            
+            ref = head[len("ref: "):]
+            ref_path = git_dir / ref
+            if ref_path.exists():
+                return ref_path.read_text().strip()
+            
+            # Refs not stored as loose files live in packed-refs
+            for line in (git_dir / "packed-refs").read_text().splitlines():
+                if line.endswith(f" {ref}"):
+                    return line.split()[0]
+        except OSError:
+            # e.g. .git is a file pointing elsewhere (worktrees, submodules)
+            pass
+        
+        try:
+            result = subprocess.run(['git', 'rev-parse', 'HEAD'],
+                                    capture_output=True, text=True, cwd=self.repo_path)
+        except OSError:
+            return None
+        return result.stdout.strip() if result.returncode == 0 else None
+    
     def get_repo_info(self):
         """Get repository owner/name for URL construction"""
+        if self._repo_info is None:
+            self._repo_info = self._compute_repo_info()
+        return self._repo_info
+    
+    def _compute_repo_info(self):
+        """Read owner/name from the origin remote URL"""
         try:
-            import subprocess
             result = subprocess.run([
                 'git', 'remote', 'get-url', 'origin'
-            ], capture_output=True, text=True)
+            ], capture_output=True, text=True, cwd=self.repo_path)
             
             if result.returncode == 0:
                 url = result.stdout.strip()
@@ -284,19 +574,23 @@ def main():
             test_output="Test output here",
             context={"test_type": "unit", "component": "example"}
         )
-        print(f"Created test issue: {issue_number}")
+        filed, _ = manager.flush_pending_issues()
+        print(f"Created test issue: {issue_number or filed.get('test_example')}")
     
     if args.test_resolve:
         resolved = manager.resolve_bug_issue("test_example")
-        print(f"Resolved test issue: {resolved}")
+        _, closed = manager.flush_pending_issues()
+        print(f"Resolved test issue: {resolved and bool(closed)}")
     
     if args.stats:
         stats = manager.get_bug_statistics()
-        print("📊 Bug Statistics:")
-        print(f"  Total bugs found: {stats['total_bugs_found']}")
-        print(f"  Currently tracked: {stats['currently_tracked']}")
-        print(f"  Resolved bugs: {stats['resolved_bugs']}")
-        print(f"  Resolution rate: {stats['resolution_rate']:.2%}")
+        sys.stdout.write(
+            "📊 Bug Statistics:\n"
+            f"  Total bugs found: {stats['total_bugs_found']}\n"
+            f"  Currently tracked: {stats['currently_tracked']}\n"
+            f"  Resolved bugs: {stats['resolved_bugs']}\n"
+            f"  Resolution rate: {stats['resolution_rate']:.2%}\n"
+        )
     
     if args.list_bugs:
         bugs = manager.list_tracked_bugs()
@@ -5,401 +5,362 @@ Automatically generates comprehensive tests based on function analysis
 """
 
 import os
+import io
 import sys
 import ast
 import inspect
 import json
+import functools
+import concurrent.futures
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 
-class IntelligentTestGenerator:
-    """Generates intelligent, comprehensive tests for new functionality"""
+# Fixed parts of a generated test file, around the timestamp line and the
+# per-function test classes
+_FILE_HEADER_LINES = (
+    "#!/usr/bin/env python3\n",
+    '"""\n',
+    "Comprehensive automated tests\n",
+)
+
+_FILE_IMPORT_LINES = (
+    '"""\n',
+    "\n",
+    "import sys\n",
+    "import os\n",
+    "import pytest\n",
+    "import time\n",
+    "from unittest.mock import patch, MagicMock, Mock\n",
+    "from pathlib import Path\n",
+    "\n",
+    "# Add project to path\n",
+    "sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))\n",
+    "\n",
+)
+
+_FILE_RUNNER_LINES = (
+    "\n",
+    "def run_comprehensive_tests():\n",
+    '    """Run all comprehensive tests"""\n',
+    "    \n",
+    "    print('🧪 RUNNING COMPREHENSIVE AUTOMATED TESTS')\n",
+    "    print('=' * 50)\n",
+    "    \n",
+    "    # Run pytest with verbose output\n",
+    "    import subprocess\n",
+    "    result = subprocess.run([\n",
+    "        'python', '-m', 'pytest', __file__, '-v'\n",
+    "    ], capture_output=True, text=True)\n",
+    "    \n",
+    "    print(result.stdout)\n",
+    "    if result.stderr:\n",
+    "        print('STDERR:', result.stderr)\n",
+    "    \n",
+    "    return result.returncode == 0\n",
+    "\n",
+    "\n",
+    "if __name__ == '__main__':\n",
+    "    run_comprehensive_tests()\n",
+)
+
+# Name fragments that call for performance and security tests
+_PERFORMANCE_KEYWORDS = frozenset(("process", "parse", "search", "compute", "calculate"))
+_SECURITY_KEYWORDS = frozenset(("auth", "login", "password", "token", "validate", "sanitize"))
+
+# Arg name fragments and the test data they need, in priority order
+_ARG_DATA_NEEDS = (
+    ("email", "email_addresses"),
+    ("url", "urls"),
+    ("name", "names"),
+    ("id", "identifiers"),
+)
+
+# Arg name fragments and the sample value passed for them, in priority order
+_ARG_TEST_VALUES = (
+    ("email", 'self.test_data["valid_email"]'),
+    ("name", 'self.test_data["valid_name"]'),
+    ("url", 'self.test_data["valid_url"]'),
+)
+
+class _FunctionFactsVisitor(ast.NodeVisitor):
+    """Collects per-function facts from a module in a single pass"""
     
-    def __init__(self, repo_path: str = "."):
-        self.repo_path = Path(repo_path)
-        self.test_patterns = {
-            "happy_path": "Test normal, expected usage",
-            "edge_cases": "Test boundary conditions and edge cases", 
-            "error_handling": "Test error conditions and exception handling",
-            "integration": "Test interaction with other components",
-            "performance": "Test performance characteristics",
-            "security": "Test security aspects and input validation"
-        }
-        
-    def analyze_function(self, func_info: Dict) -> Dict[str, Any]:
-        """Analyze a function to understand what tests it needs"""
-        
-        analysis = {
-            "name": func_info["name"],
-            "file": func_info["file"],
-            "complexity": "medium",
-            "test_categories": [],
-            "mock_requirements": [],
-            "test_data_needs": [],
-            "security_considerations": [],
-            "performance_considerations": []
-        }
-        
-        # Analyze function signature
-        args = func_info.get("args", [])
-        docstring = func_info.get("docstring", "")
-        
-        # Determine complexity
-        if len(args) > 5 or "async" in func_info.get("name", ""):
-            analysis["complexity"] = "high"
-        elif len(args) <= 2 and not docstring:
-            analysis["complexity"] = "low"
-        
-        # Determine test categories needed
-        if not func_info.get("is_private", False):
-            analysis["test_categories"].append("happy_path")
-        
-        # Check for error handling needs
-        if "raise" in docstring.lower() or "error" in docstring.lower() or "exception" in docstring.lower():
-            analysis["test_categories"].append("error_handling")
-        
-        # Check for integration needs
-        if "self" in args or len(args) > 3:
-            analysis["test_categories"].append("integration")
-        
-        # Check for performance considerations
-        if any(keyword in func_info["name"].lower() for keyword in ["process", "parse", "search", "compute", "calculate"]):
-            analysis["test_categories"].append("performance")
-            analysis["performance_considerations"].append("execution_time")
-        
-        # Check for security considerations
-        if any(keyword in func_info["name"].lower() for keyword in ["auth", "login", "password", "token", "validate", "sanitize"]):
-            analysis["test_categories"].append("security")
-            analysis["security_considerations"].extend(["input_validation", "injection_prevention"])
-        
-        # Determine mock requirements
-        if "file" in args or "path" in args:
-            analysis["mock_requirements"].append("file_system")
-        if "request" in args or "response" in args:
-            analysis["mock_requirements"].append("http_requests")
-        if "db" in args or "database" in args:
-            analysis["mock_requirements"].append("database")
-        
-        # Determine test data needs
-        for arg in args:
-            if "email" in arg.lower():
-                analysis["test_data_needs"].append("email_addresses")
-            elif "url" in arg.lower():
-                analysis["test_data_needs"].append("urls")
-            elif "name" in arg.lower():
-                analysis["test_data_needs"].append("names")
-            elif "id" in arg.lower():
-                analysis["test_data_needs"].append("identifiers")
-        
-        return analysis
+    def __init__(self):
+        self.facts = {}
+        self._scope = []
+        self._stack = []
     
-    def generate_test_class(self, func_info: Dict, analysis: Dict) -> str:
-        """Generate a comprehensive test class for a function"""
-        
-        class_name = f"Test{func_info['name'].title().replace('_', '')}"
-        lines = []
-        
-        # Class header
-        lines.append(f"class {class_name}:")
-        lines.append(f'    """Comprehensive tests for {func_info["name"]} functionality"""')
-        lines.append("")
-        
-        # Setup method if needed
-        if analysis["mock_requirements"] or analysis["complexity"] == "high":
-            lines.extend(self._generate_setup_method(func_info, analysis))
-        
-        # Generate tests for each category
-        for category in analysis["test_categories"]:
-            test_methods = self._generate_test_methods(func_info, analysis, category)
-            lines.extend(test_methods)
-        
-        # Add edge cases if not already covered
-        if "edge_cases" not in analysis["test_categories"]:
-            lines.extend(self._generate_edge_case_tests(func_info, analysis))
-        
-        return "\n".join(lines)
+    def visit_ClassDef(self, node):
+        self._scope.append(node.name)
+        self.generic_visit(node)
+        self._scope.pop()
     
-    def _generate_setup_method(self, func_info: Dict, analysis: Dict) -> List[str]:
-        """Generate setup method for test class"""
-        
-        lines = []
-        lines.append("    def setup_method(self):")
-        lines.append('        """Set up test fixtures before each test method"""')
-        
-        # Mock setup
-        if "file_system" in analysis["mock_requirements"]:
-            lines.append("        self.mock_file_system = MagicMock()")
-        if "http_requests" in analysis["mock_requirements"]:
-            lines.append("        self.mock_requests = MagicMock()")
-        if "database" in analysis["mock_requirements"]:
-            lines.append("        self.mock_db = MagicMock()")
-        
-        # Test data setup
-        lines.append("        self.test_data = {")
-        for data_type in analysis["test_data_needs"]:
-            if data_type == "email_addresses":
-                lines.append('            "valid_email": "test@example.com",')
-                lines.append('            "invalid_email": "invalid-email",')
-            elif data_type == "urls":
-                lines.append('            "valid_url": "https://example.com",')
-                lines.append('            "invalid_url": "not-a-url",')
-            elif data_type == "names":
-                lines.append('            "valid_name": "John Doe",')
-                lines.append('            "empty_name": "",')
-        lines.append("        }")
-        lines.append("")
-        
-        return lines
-    
-    def _generate_test_methods(self, func_info: Dict, analysis: Dict, category: str) -> List[str]:
-        """Generate test methods for a specific category"""
-        
-        lines = []
-        method_name = f"test_{func_info['name']}_{category}"
-        
-        lines.append(f"    def {method_name}(self):")
-        lines.append(f'        """{self.test_patterns[category]}"""')
-        
-        if category == "happy_path":
-            lines.extend(self._generate_happy_path_test(func_info, analysis))
-        elif category == "error_handling":
-            lines.extend(self._generate_error_handling_test(func_info, analysis))
-        elif category == "integration":
-            lines.extend(self._generate_integration_test(func_info, analysis))
-        elif category == "performance":
-            lines.extend(self._generate_performance_test(func_info, analysis))
-        elif category == "security":
-            lines.extend(self._generate_security_test(func_info, analysis))
-        else:
-            lines.append("        # TODO: Implement specific test logic")
-            lines.append("        pass")
-        
-        lines.append("")
-        return lines
+    def _visit_function(self, node):
+        facts = {"raises": False}
+        self._scope.append(node.name)
+        self.facts[".".join(self._scope)] = facts
+        self._stack.append(facts)
+        self.generic_visit(node)
+        self._stack.pop()
+        self._scope.pop()
     
-    def _generate_happy_path_test(self, func_info: Dict, analysis: Dict) -> List[str]:
-        """Generate happy path test implementation"""
-        
-        lines = []
-        lines.append("        # Test normal, successful execution")
-        
-        # Import the function
-        module_path = func_info["file"].replace("/", ".").replace(".py", "")
-        lines.append(f"        from {module_path} import {func_info['name']}")
-        lines.append("")
-        
-        # Generate test call
-        args = func_info.get("args", [])
-        if args:
-            # Create sample arguments
-            test_args = []
-            for arg in args:
-                if arg == "self":
-                    continue
-                elif "email" in arg.lower():
-                    test_args.append('self.test_data["valid_email"]')
-                elif "name" in arg.lower():
-                    test_args.append('self.test_data["valid_name"]')
-                elif "url" in arg.lower():
-                    test_args.append('self.test_data["valid_url"]')
-                else:
-                    test_args.append(f'"test_{arg}"')
-            
-            lines.append(f"        result = {func_info['name']}({', '.join(test_args)})")
-        else:
-            lines.append(f"        result = {func_info['name']}()")
-        
-        lines.append("        ")
-        lines.append("        # Verify expected behavior")
-        lines.append("        assert result is not None, 'Function should return a result'")
-        lines.append("        # TODO: Add specific assertions based on expected behavior")
-        
-        return lines
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
     
-    def _generate_error_handling_test(self, func_info: Dict, analysis: Dict) -> List[str]:
-        """Generate error handling test implementation"""
-        
-        lines = []
-        lines.append("        # Test error conditions and exception handling")
-        
-        module_path = func_info["file"].replace("/", ".").replace(".py", "")
-        lines.append(f"        from {module_path} import {func_info['name']}")
-        lines.append("")
-        
-        # Test with invalid inputs
-        lines.append("        # Test with invalid inputs")
-        lines.append("        with pytest.raises(Exception):")
-        
-        args = func_info.get("args", [])
-        if args and args != ["self"]:
-            lines.append(f"            {func_info['name']}(None)  # Invalid input")
-        else:
-            lines.append(f"            # TODO: Identify specific error conditions for {func_info['name']}")
-        
-        lines.append("")
-        lines.append("        # Test edge cases that might cause errors")
-        lines.append("        # TODO: Add specific error condition tests")
-        
-        return lines
+    def visit_Raise(self, node):
+        if self._stack:
+            self._stack[-1]["raises"] = True
+        self.generic_visit(node)
+
+
+@functools.lru_cache(maxsize=512)
+def _file_ast(path: str) -> Dict[str, Dict[str, Any]]:
+    """Parse a source file once and return facts keyed by qualified name (Class.method)"""
+    try:
+        tree = ast.parse(Path(path).read_text(encoding="utf-8"), filename=path)
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return {}
     
-    def _generate_integration_test(self, func_info: Dict, analysis: Dict) -> List[str]:
-        """Generate integration test implementation"""
-        
-        lines = []
-        lines.append("        # Test integration with other components")
-        
-        if "file_system" in analysis["mock_requirements"]:
-            lines.append("        with patch('builtins.open', self.mock_file_system):")
-            lines.append(f"            # Test file operations")
-            lines.append(f"            # TODO: Test file interaction scenarios")
-        
-        if "http_requests" in analysis["mock_requirements"]:
-            lines.append("        with patch('requests.get', self.mock_requests):")
-            lines.append(f"            # Test HTTP request scenarios")
-            lines.append(f"            # TODO: Test request/response handling")
-        
-        if not analysis["mock_requirements"]:
-            lines.append("        # TODO: Test interaction with other system components")
-            lines.append("        pass")
-        
-        return lines
+    visitor = _FunctionFactsVisitor()
+    visitor.visit(tree)
+    return visitor.facts
+
+
+# Maps source path separators to dots when building import paths
+_PATH_TRANS = str.maketrans({"/": ".", "\\": "."})
+
+# Test categories whose generated bodies import the function under test
+_IMPORTING_CATEGORIES = frozenset({"happy_path", "error_handling"})
+
+
+def _import_path(file: str) -> str:
+    """Dotted module path for a source file, e.g. pkg/mod.py -> pkg.mod"""
+    module_path = file.translate(_PATH_TRANS)
+    if module_path.endswith(".py"):
+        module_path = module_path[:-3]
+    return module_path
+
+
+# Shared placeholder for analysis fields that have nothing in them
+_EMPTY = ()
+
+
+def _append(analysis: Dict[str, Any], field: str, *values: str) -> None:
+    """Add values to an analysis field, swapping _EMPTY for a list on first write"""
+    current = analysis[field]
+    if current is _EMPTY:
+        analysis[field] = list(values)
+    else:
+        current.extend(values)
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_cached(key: Tuple) -> Dict[str, Any]:
+    """Analyze a (name, is_private, args, docstring, file, raises) function signature.
     
-    def _generate_performance_test(self, func_info: Dict, analysis: Dict) -> List[str]:
-        """Generate performance test implementation"""
-        
-        lines = []
-        lines.append("        # Test performance characteristics")
-        lines.append("        import time")
-        lines.append("")
-        lines.append("        start_time = time.time()")
-        lines.append(f"        # TODO: Call {func_info['name']} with performance test data")
-        lines.append("        end_time = time.time()")
-        lines.append("")
-        lines.append("        execution_time = end_time - start_time")
-        lines.append("        assert execution_time < 1.0, 'Function should complete within 1 second'")
-        lines.append("        # TODO: Adjust time limits based on expected performance")
-        
-        return lines
-    
-    def _generate_security_test(self, func_info: Dict, analysis: Dict) -> List[str]:
-        """Generate security test implementation"""
-        
-        lines = []
-        lines.append("        # Test security aspects and input validation")
-        
-        if "input_validation" in analysis["security_considerations"]:
-            lines.append("        # Test input validation")
-            lines.append("        malicious_inputs = [")
-            lines.append('            "<script>alert(\'xss\')</script>",')
-            lines.append('            "'; DROP TABLE users; --",')
-            lines.append('            "../../../etc/passwd",')
-            lines.append('            "\\x00\\x01\\x02"')
-            lines.append("        ]")
-            lines.append("")
-            lines.append("        for malicious_input in malicious_inputs:")
-            lines.append("            # TODO: Verify malicious input is properly handled")
-            lines.append("            pass")
-        
-        if "injection_prevention" in analysis["security_considerations"]:
-            lines.append("        # Test injection prevention")
-            lines.append("        # TODO: Test SQL injection, command injection prevention")
-        
-        return lines
+    ``raises`` comes from the parsed source and is None when the source was
+    not available, in which case the docstring is used as a hint instead.
+    Results are cached across calls, so list fields are returned as tuples.
+    """
+    name, is_private, args, docstring, file, raises = key
     
-    def _generate_edge_case_tests(self, func_info: Dict, analysis: Dict) -> List[str]:
-        """Generate edge case tests"""
-        
-        lines = []
-        lines.append(f"    def test_{func_info['name']}_edge_cases(self):")
-        lines.append('        """Test boundary conditions and edge cases"""')
-        
-        args = func_info.get("args", [])
-        if args and args != ["self"]:
-            lines.append("        # Test with boundary values")
-            lines.append("        test_cases = [")
-            lines.append('            "",  # Empty string')
-            lines.append('            None,  # None value')
-            lines.append('            [],  # Empty list')
-            lines.append('            {},  # Empty dict')
-            lines.append("        ]")
-            lines.append("")
-            lines.append("        for test_case in test_cases:")
-            lines.append("            try:")
-            lines.append(f"                result = {func_info['name']}(test_case)")
-            lines.append("                # TODO: Verify behavior with edge case inputs")
-            lines.append("            except Exception as e:")
-            lines.append("                # TODO: Verify expected exceptions")
-            lines.append("                pass")
-        else:
-            lines.append("        # TODO: Identify relevant edge cases")
-            lines.append("        pass")
-        
-        lines.append("")
-        return lines
+    analysis = {
+        "name": name,
+        "file": file,
+        "complexity": "medium",
+        "test_categories": _EMPTY,
+        "mock_requirements": _EMPTY,
+        "test_data_needs": _EMPTY,
+        "security_considerations": _EMPTY,
+        "performance_considerations": _EMPTY
+    }
     
-    def generate_comprehensive_test_file(self, functions: List[Dict]) -> str:
-        """Generate a complete test file for multiple functions"""
-        
-        lines = []
-        
-        # File header
-        lines.append("#!/usr/bin/env python3")
-        lines.append('"""')
-        lines.append('Comprehensive automated tests')
-        lines.append(f'Generated by Intelligent Test Generator on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-        lines.append('"""')
-        lines.append("")
-        
-        # Imports
-        lines.append("import sys")
-        lines.append("import os")
-        lines.append("import pytest")
-        lines.append("import time")
-        lines.append("from unittest.mock import patch, MagicMock, Mock")
-        lines.append("from pathlib import Path")
-        lines.append("")
-        lines.append("# Add project to path")
-        lines.append("sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))")
-        lines.append("")
-        
-        # Generate test classes for each function
-        for func_info in functions:
-            analysis = self.analyze_function(func_info)
-            test_class = self.generate_test_class(func_info, analysis)
-            lines.append(test_class)
-            lines.append("")
-        
-        # Test runner
-        lines.append("")
-        lines.append("def run_comprehensive_tests():")
-        lines.append('    """Run all comprehensive tests"""')
-        lines.append("    ")
-        lines.append("    print('🧪 RUNNING COMPREHENSIVE AUTOMATED TESTS')")
-        lines.append("    print('=' * 50)")
-        lines.append("    ")
-        lines.append("    # Run pytest with verbose output")
-        lines.append("    import subprocess")
-        lines.append("    result = subprocess.run([")
-        lines.append("        'python', '-m', 'pytest', __file__, '-v'")
-        lines.append("    ], capture_output=True, text=True)")
-        lines.append("    ")
-        lines.append("    print(result.stdout)")
-        lines.append("    if result.stderr:")
-        lines.append("        print('STDERR:', result.stderr)")
-        lines.append("    ")
-        lines.append("    return result.returncode == 0")
-        lines.append("")
-        lines.append("")
-        lines.append("if __name__ == '__main__':")
-        lines.append("    run_comprehensive_tests()")
-        
-        return "\n".join(lines)
+    # Determine complexity
+    if len(args) > 5 or "async" in name:
+        analysis["complexity"] = "high"
+    elif len(args) <= 2 and not docstring:
+        analysis["complexity"] = "low"
     
-    def create_test_automation_workflow(self):
-        """Create GitHub Actions workflow for automated test generation"""
-        
-        workflow_content = '''name: 🤖 Automated Test Generation
+    # Determine test categories needed
+    if not is_private:
+        _append(analysis, "test_categories", "happy_path")
+    
+    name_lower = name.lower()
+    docstring_lower = docstring.lower()
+    
+    # Check for error handling needs
+    if raises is None:
+        raises = "raise" in docstring_lower or "error" in docstring_lower or "exception" in docstring_lower
+    if raises:
+        _append(analysis, "test_categories", "error_handling")
+    
+    # Check for integration needs
+    if "self" in args or len(args) > 3:
+        _append(analysis, "test_categories", "integration")
+    
+    # Check for performance considerations
+    if any(keyword in name_lower for keyword in _PERFORMANCE_KEYWORDS):
+        _append(analysis, "test_categories", "performance")
+        _append(analysis, "performance_considerations", "execution_time")
+    
+    # Check for security considerations
+    if any(keyword in name_lower for keyword in _SECURITY_KEYWORDS):
+        _append(analysis, "test_categories", "security")
+        _append(analysis, "security_considerations", "input_validation", "injection_prevention")
+    
+    # Determine mock requirements
+    if "file" in args or "path" in args:
+        _append(analysis, "mock_requirements", "file_system")
+    if "request" in args or "response" in args:
+        _append(analysis, "mock_requirements", "http_requests")
+    if "db" in args or "database" in args:
+        _append(analysis, "mock_requirements", "database")
+    
+    # Determine test data needs
+    for arg in args:
+        arg_lower = arg.lower()
+        for fragment, data_need in _ARG_DATA_NEEDS:
+            if fragment in arg_lower:
+                _append(analysis, "test_data_needs", data_need)
+                break
+    
+    return {
+        field: tuple(value) if isinstance(value, list) else value
+        for field, value in analysis.items()
+    }
+
+
+# Templates for the generated test code. Blocks are joined with "\n"; a
+# template ending in "\n" is followed by a blank line
+_CLASS_HEADER_TEMPLATE = (
+    "class {class_name}:\n"
+    '    """Comprehensive tests for {name} functionality"""\n'
+)
+
+_SETUP_MOCK_LINES = (
+    ("file_system", "        self.mock_file_system = MagicMock()"),
+    ("http_requests", "        self.mock_requests = MagicMock()"),
+    ("database", "        self.mock_db = MagicMock()"),
+)
+
+_SETUP_TEST_DATA_LINES = {
+    "email_addresses": (
+        '            "valid_email": "test@example.com",\n'
+        '            "invalid_email": "invalid-email",'
+    ),
+    "urls": (
+        '            "valid_url": "https://example.com",\n'
+        '            "invalid_url": "not-a-url",'
+    ),
+    "names": (
+        '            "valid_name": "John Doe",\n'
+        '            "empty_name": "",'
+    ),
+}
+
+_HAPPY_PATH_TEMPLATE = (
+    "        # Test normal, successful execution\n"
+    "        from {module_path} import {name}\n"
+    "\n"
+    "        result = {name}({call_args})\n"
+    "        \n"
+    "        # Verify expected behavior\n"
+    "        assert result is not None, 'Function should return a result'\n"
+    "        # TODO: Add specific assertions based on expected behavior"
+)
+
+_ERROR_HANDLING_TEMPLATE = (
+    "        # Test error conditions and exception handling\n"
+    "        from {module_path} import {name}\n"
+    "\n"
+    "        # Test with invalid inputs\n"
+    "        with pytest.raises(Exception):\n"
+    "{invalid_call}\n"
+    "\n"
+    "        # Test edge cases that might cause errors\n"
+    "        # TODO: Add specific error condition tests"
+)
+
+_INTEGRATION_FILE_SYSTEM = (
+    "        with patch('builtins.open', self.mock_file_system):\n"
+    "            # Test file operations\n"
+    "            # TODO: Test file interaction scenarios"
+)
+
+_INTEGRATION_HTTP_REQUESTS = (
+    "        with patch('requests.get', self.mock_requests):\n"
+    "            # Test HTTP request scenarios\n"
+    "            # TODO: Test request/response handling"
+)
+
+_INTEGRATION_NO_MOCKS = (
+    "        # TODO: Test interaction with other system components\n"
+    "        pass"
+)
+
+_PERFORMANCE_TEMPLATE = (
+    "        # Test performance characteristics\n"
+    "        import time\n"
+    "\n"
+    "        start_time = time.time()\n"
+    "        # TODO: Call {name} with performance test data\n"
+    "        end_time = time.time()\n"
+    "\n"
+    "        execution_time = end_time - start_time\n"
+    "        assert execution_time < 1.0, 'Function should complete within 1 second'\n"
+    "        # TODO: Adjust time limits based on expected performance"
+)
+
+_SECURITY_INPUT_VALIDATION = (
+    "        # Test input validation\n"
+    "        malicious_inputs = [\n"
+    '            "<script>alert(\'xss\')</script>",\n'
+    '            "\'; DROP TABLE users; --",\n'
+    '            "../../../etc/passwd",\n'
+    '            "\\x00\\x01\\x02"\n'
+    "        ]\n"
+    "\n"
+    "        for malicious_input in malicious_inputs:\n"
+    "            # TODO: Verify malicious input is properly handled\n"
+    "            pass"
+)
+
+_SECURITY_INJECTION_PREVENTION = (
+    "        # Test injection prevention\n"
+    "        # TODO: Test SQL injection, command injection prevention"
+)
+
+_EDGE_CASE_TEMPLATE = (
+    "    def test_{name}_edge_cases(self):\n"
+    '        """Test boundary conditions and edge cases"""\n'
+    "        # Test with boundary values\n"
+    "        test_cases = [\n"
+    '            "",  # Empty string\n'
+    "            None,  # None value\n"
+    "            [],  # Empty list\n"
+    "            {{}},  # Empty dict\n"
+    "        ]\n"
+    "\n"
+    "        for test_case in test_cases:\n"
+    "            try:\n"
+    "                result = {name}(test_case)\n"
+    "                # TODO: Verify behavior with edge case inputs\n"
+    "            except Exception as e:\n"
+    "                # TODO: Verify expected exceptions\n"
+    "                pass\n"
+)
+
+_EDGE_CASE_NO_ARGS_TEMPLATE = (
+    "    def test_{name}_edge_cases(self):\n"
+    '        """Test boundary conditions and edge cases"""\n'
+    "        # TODO: Identify relevant edge cases\n"
+    "        pass\n"
+)
+
+
+# GitHub Actions workflow written by --setup-workflow, encoded once at import
+_WORKFLOW_YAML = '''name: 🤖 Automated Test Generation
 
 on:
   push:
@@ -486,17 +447,246 @@ I've automatically generated test templates for new functionality.
 
 *Generated by Automated Test Generation workflow*`
           })
-'''
+'''.encode("utf-8")
+
+
+class IntelligentTestGenerator:
+    """Generates intelligent, comprehensive tests for new functionality"""
+    
+    def __init__(self, repo_path: str = "."):
+        self.repo_path = Path(repo_path)
+        self.test_patterns = {
+            "happy_path": "Test normal, expected usage",
+            "edge_cases": "Test boundary conditions and edge cases", 
+            "error_handling": "Test error conditions and exception handling",
+            "integration": "Test interaction with other components",
+            "performance": "Test performance characteristics",
+            "security": "Test security aspects and input validation"
+        }
+        
+        # Method signature and docstring per category, leaving only the
+        # function name to fill in
+        self._method_skeletons = {
+            category: f'    def test_{{name}}_{category}(self):\n        """{description}"""\n'
+            for category, description in self.test_patterns.items()
+        }
+        
+        # Body generator per test category
+        self._category_dispatch = {
+            "happy_path": self._generate_happy_path_test,
+            "error_handling": self._generate_error_handling_test,
+            "integration": self._generate_integration_test,
+            "performance": self._generate_performance_test,
+            "security": self._generate_security_test
+        }
+        
+        # One timestamp for every file generated in this run
+        self._run_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+    def analyze_function(self, func_info: Dict) -> Dict[str, Any]:
+        """Analyze a function to understand what tests it needs"""
+        qualname = func_info.get("qualname", func_info["name"])
+        facts = _file_ast(str(self.repo_path / func_info["file"])).get(qualname)
+        key = (
+            func_info["name"],
+            func_info.get("is_private", False),
+            tuple(func_info.get("args", [])),
+            func_info.get("docstring", ""),
+            func_info["file"],
+            facts["raises"] if facts else None
+        )
+        # The cached analysis is shared, so hand out fresh lists; empty
+        # fields stay as the immutable _EMPTY tuple
+        return {
+            field: list(value) if isinstance(value, tuple) and value else value
+            for field, value in _analyze_cached(key).items()
+        }
+    
+    def generate_test_class(self, func_info: Dict, analysis: Dict) -> str:
+        """Generate a comprehensive test class for a function"""
+        
+        class_name = f"Test{func_info['name'].title().replace('_', '')}"
+        
+        # Import path shared by every generated test method
+        module_path = _import_path(func_info["file"])
+        
+        # Class header
+        buf = io.StringIO()
+        buf.write(_CLASS_HEADER_TEMPLATE.format(class_name=class_name, name=func_info["name"]))
+        
+        # Setup method if needed
+        if analysis["mock_requirements"] or analysis["complexity"] == "high":
+            buf.write("\n")
+            buf.write(self._generate_setup_method(func_info, analysis))
+        
+        # Generate tests for each category
+        for category in analysis["test_categories"]:
+            buf.write("\n")
+            buf.write(self._generate_test_methods(func_info, analysis, category, module_path))
+        
+        # Add edge cases if not already covered
+        if "edge_cases" not in analysis["test_categories"]:
+            buf.write("\n")
+            buf.write(self._generate_edge_case_tests(func_info, analysis))
+        
+        return buf.getvalue()
+    
+    def _generate_setup_method(self, func_info: Dict, analysis: Dict) -> str:
+        """Generate setup method for test class"""
+        
+        lines = [
+            "    def setup_method(self):",
+            '        """Set up test fixtures before each test method"""'
+        ]
+        
+        # Mock setup
+        lines.extend(
+            line for requirement, line in _SETUP_MOCK_LINES
+            if requirement in analysis["mock_requirements"]
+        )
+        
+        # Test data setup
+        lines.append("        self.test_data = {")
+        lines.extend(
+            _SETUP_TEST_DATA_LINES[data_type] for data_type in analysis["test_data_needs"]
+            if data_type in _SETUP_TEST_DATA_LINES
+        )
+        lines.append("        }\n")
+        
+        return "\n".join(lines)
+    
+    def _generate_test_methods(self, func_info: Dict, analysis: Dict, category: str,
+                               module_path: Optional[str] = None) -> str:
+        """Generate test methods for a specific category"""
+        
+        body_fn = self._category_dispatch.get(category)
+        if category in _IMPORTING_CATEGORIES:
+            body = body_fn(func_info, analysis, module_path)
+        elif body_fn is not None:
+            body = body_fn(func_info, analysis)
+        else:
+            body = "        # TODO: Implement specific test logic\n        pass"
+        
+        return self._method_skeletons[category].format(name=func_info["name"]) + body + "\n"
+    
+    def _generate_happy_path_test(self, func_info: Dict, analysis: Dict,
+                                  module_path: Optional[str] = None) -> str:
+        """Generate happy path test implementation, importing from module_path
+        (derived from func_info["file"] when not given)"""
+        
+        # Create sample arguments
+        test_args = []
+        for arg in func_info.get("args", []):
+            if arg == "self":
+                continue
+            arg_lower = arg.lower()
+            test_args.append(next(
+                (value for fragment, value in _ARG_TEST_VALUES if fragment in arg_lower),
+                f'"test_{arg}"'
+            ))
+        
+        return _HAPPY_PATH_TEMPLATE.format(
+            module_path=module_path or _import_path(func_info["file"]),
+            name=func_info["name"],
+            call_args=", ".join(test_args)
+        )
+    
+    def _generate_error_handling_test(self, func_info: Dict, analysis: Dict,
+                                      module_path: Optional[str] = None) -> str:
+        """Generate error handling test implementation, importing from module_path
+        (derived from func_info["file"] when not given)"""
+        
+        args = func_info.get("args", [])
+        if args and args != ["self"]:
+            invalid_call = f"            {func_info['name']}(None)  # Invalid input"
+        else:
+            invalid_call = f"            # TODO: Identify specific error conditions for {func_info['name']}"
+        
+        return _ERROR_HANDLING_TEMPLATE.format(
+            module_path=module_path or _import_path(func_info["file"]),
+            name=func_info["name"],
+            invalid_call=invalid_call
+        )
+    
+    def _generate_integration_test(self, func_info: Dict, analysis: Dict) -> str:
+        """Generate integration test implementation"""
+        
+        blocks = ["        # Test integration with other components"]
+        
+        if "file_system" in analysis["mock_requirements"]:
+            blocks.append(_INTEGRATION_FILE_SYSTEM)
+        
+        if "http_requests" in analysis["mock_requirements"]:
+            blocks.append(_INTEGRATION_HTTP_REQUESTS)
+        
+        if not analysis["mock_requirements"]:
+            blocks.append(_INTEGRATION_NO_MOCKS)
+        
+        return "\n".join(blocks)
+    
+    def _generate_performance_test(self, func_info: Dict, analysis: Dict) -> str:
+        """Generate performance test implementation"""
+        return _PERFORMANCE_TEMPLATE.format(name=func_info["name"])
+    
+    def _generate_security_test(self, func_info: Dict, analysis: Dict) -> str:
+        """Generate security test implementation"""
+        
+        blocks = ["        # Test security aspects and input validation"]
+        
+        if "input_validation" in analysis["security_considerations"]:
+            blocks.append(_SECURITY_INPUT_VALIDATION)
+        
+        if "injection_prevention" in analysis["security_considerations"]:
+            blocks.append(_SECURITY_INJECTION_PREVENTION)
+        
+        return "\n".join(blocks)
+    
+    def _generate_edge_case_tests(self, func_info: Dict, analysis: Dict) -> str:
+        """Generate edge case tests"""
+        
+        args = func_info.get("args", [])
+        if args and args != ["self"]:
+            return _EDGE_CASE_TEMPLATE.format(name=func_info["name"])
+        return _EDGE_CASE_NO_ARGS_TEMPLATE.format(name=func_info["name"])
+    
+    def generate_comprehensive_test_file(self, functions: List[Dict], out_fp) -> None:
+        """Write a complete test file for multiple functions to out_fp"""
+        
+        if not functions:
+            return
+        
+        # File header
+        out_fp.writelines(_FILE_HEADER_LINES)
+        out_fp.write(f'Generated by Intelligent Test Generator on {self._run_timestamp}\n')
+        out_fp.writelines(_FILE_IMPORT_LINES)
+        
+        # Generate test classes for each function, writing each as it's built
+        for func_info in functions:
+            analysis = self.analyze_function(func_info)
+            out_fp.write(self.generate_test_class(func_info, analysis))
+            out_fp.write("\n\n")
+        
+        # Test runner
+        out_fp.writelines(_FILE_RUNNER_LINES)
+    
+    def create_test_automation_workflow(self):
+        """Create GitHub Actions workflow for automated test generation"""
         
         workflow_path = self.repo_path / ".github/workflows/auto-test-generation.yml"
         workflow_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(workflow_path, 'w') as f:
-            f.write(workflow_content)
+        workflow_path.write_bytes(_WORKFLOW_YAML)
         
         print(f"✅ Created automated test generation workflow: {workflow_path}")
 
 
+def _gen_one_category(generator: IntelligentTestGenerator, category: str, items: List[Dict]) -> Path:
+    """Write the comprehensive test file for one category; runs in a worker process"""
+    output_path = Path("tests/generated") / f"comprehensive_{category}.py"
+    with open(output_path, 'w') as f:
+        generator.generate_comprehensive_test_file(items, f)
+    return output_path
+
+
 def main():
     """Main function with CLI interface"""
     import argparse
@@ -524,18 +714,18 @@ def main():
         functionality = enforcer.scan_for_new_functionality()
         missing_tests = enforcer.identify_missing_tests(functionality)
         
-        # Generate comprehensive tests for missing coverage
-        for category, items in missing_tests.items():
-            if items:
-                test_file_content = generator.generate_comprehensive_test_file(items)
-                
-                output_path = Path("tests/generated") / f"comprehensive_{category}.py"
-                output_path.parent.mkdir(exist_ok=True)
-                
-                with open(output_path, 'w') as f:
-                    f.write(test_file_content)
-                
-                print(f"✅ Generated comprehensive tests: {output_path}")
+        # Generate comprehensive tests for missing coverage, one category per worker
+        pending = [(category, items) for category, items in missing_tests.items() if items]
+        if pending:
+            Path("tests/generated").mkdir(exist_ok=True)
+            workers = min(len(pending), os.cpu_count() or 1)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_gen_one_category, generator, category, items)
+                    for category, items in pending
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    print(f"✅ Generated comprehensive tests: {future.result()}")
     
     else:
         print("🧪 INTELLIGENT TEST GENERATOR")
@@ -12,7 +12,13 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from philosopher_dinner.forum.graph import PhilosopherForum
-from philosopher_dinner.forum.state import ForumConfig, ForumMode
+from philosopher_dinner.forum.state import ForumConfig, ForumMode, MessageType
+
+_AGENT = MessageType.AGENT
+
+# ForumConfig is a TypedDict, so created_at can't be computed lazily; inline
+# chats only show it for information, so they all share the import time
+_CREATED_AT = datetime.now()
 
 class InlinePhilosopherChat:
     """Interactive chat that can be run inline"""
@@ -25,14 +31,19 @@ class InlinePhilosopherChat:
             description="Interactive chat session",
             mode=ForumMode.EXPLORATION,
             participants=["socrates"],
-            created_at=datetime.now(),
+            created_at=_CREATED_AT,
             settings={}
         )
         
-        # Create the forum
+        # Create the forum. Each chat gets its own: the forum's agents keep
+        # conversation memory, so a shared forum would leak history between chats
         self.forum = PhilosopherForum(config)
         self.current_state = None
         
+        # Bound once; chat() calls one of these every turn
+        self._start = self.forum.start_conversation
+        self._continue = self.forum.continue_conversation
+        
         print("🏛️ PHILOSOPHER DINNER - INLINE CHAT")
         print("=" * 50)
         print("Welcome! You're now chatting with Socrates.")
@@ -44,20 +55,23 @@ class InlinePhilosopherChat:
         
         print(f"\n🧑 You: {human_message}")
         
-        if self.current_state is None:
+        state = self.current_state
+        if state is None:
             # Start new conversation
-            self.current_state = self.forum.start_conversation(human_message)
+            state = self._start(human_message)
         else:
             # Continue conversation
-            self.current_state = self.forum.continue_conversation(self.current_state, human_message)
+            state = self._continue(state, human_message)
+        self.current_state = state
         
-        # Get the latest agent response
-        agent_messages = [msg for msg in self.current_state["messages"] 
-                         if msg["message_type"].value == "agent"]
+        # Get the latest agent response, scanning back from the newest message
+        latest_response = next(
+            (msg for msg in reversed(state["messages"])
+             if msg["message_type"] is _AGENT),
+            None
+        )
         
-        if agent_messages:
-            latest_response = agent_messages[-1]
-            
+        if latest_response is not None:
             print(f"\n🏛️ Socrates:")
             if latest_response.get("thinking"):
                 print(f"   💭 (thinking: {latest_response['thinking']})")
@@ -7,12 +7,156 @@ Continuously monitors GitHub issues and attempts to fix them automatically.
 import os
 import sys
 import json
+import atexit
 import time
+import shutil
 import subprocess
+import threading
+import http.server
+import hashlib
+import hmac
+import queue
 import re
-from datetime import datetime, timedelta
+import functools
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+import github_api
+
+# Use orjson for the agent database when it's installed, json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Minimum seconds between agent database writes while issues are processed
+DB_FLUSH_INTERVAL = 5
+
+# Logged changes after which the agent log is rewritten as just the current state
+DB_COMPACT_EVERY = 1000
+
+# Error patterns that select a fix strategy, in priority order as
+# (name, pattern, fix confidence, fix strategy)
+_ERROR_PATTERNS = (
+    ("help_command_error", r"help.*command.*not.*work|Help functionality.*broken|_show_help.*error", 0.9, "fix_help_command"),
+    ("exception_in_help", r"Exception.*Help functionality.*broken|raise Exception.*help", 0.9, "fix_help_command"),
+    ("goodbye_functionality_error", r"Goodbye functionality.*broken|_print_goodbye.*error|raise Exception.*goodbye", 0.95, "fix_goodbye_functionality"),
+    ("test_system_error", r"testing automated bug resolution system|PRODUCTION TEST", 0.95, "fix_goodbye_functionality"),
+    ("import_error", r"ModuleNotFoundError|ImportError", 0.6, "fix_import_error"),
+    ("assertion_error", r"AssertionError", 0.4, "fix_assertion_error"),
+    ("recursion_error", r"RecursionError|maximum recursion depth", 0.7, "fix_recursion_error"),
+)
+
+# All error patterns as one regex so a body is scanned once. Each pattern is
+# wrapped in a lookahead so no match hides another; where several match at
+# the same position the higher-priority one is reported
+_ERROR_PATTERN_RE = re.compile(
+    "|".join(f"(?=(?P<{name}>{pattern}))" for name, pattern, _, _ in _ERROR_PATTERNS),
+    re.IGNORECASE
+)
+_ERROR_PATTERN_RANK = {name: rank for rank, (name, *_) in enumerate(_ERROR_PATTERNS)}
+
+_TEST_NAME_RE = re.compile(r'test_[a-zA-Z_]+')
+
+
+@functools.lru_cache(maxsize=1024)
+def _scan_issue_body(body: str, find_strategy: bool) -> Tuple[Tuple[str, ...], Optional[int]]:
+    """Return the test names in an issue body and, if find_strategy is set and
+    there are any, the rank of its highest-priority error pattern.
+    
+    Cached, so an issue body seen again is not rescanned.
+    """
+    test_names = tuple(_TEST_NAME_RE.findall(body))
+    if not (find_strategy and test_names):
+        return test_names, None
+    
+    best = None
+    for match in _ERROR_PATTERN_RE.finditer(body):
+        rank = _ERROR_PATTERN_RANK[match.lastgroup]
+        if best is None or rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return test_names, best
+
+
+def _marker_scanner(*markers: bytes):
+    """Compile byte strings into one regex that finds all of them in a single pass"""
+    # The lookahead keeps matches zero-width so one marker never hides another
+    return re.compile(b"(?=(" + b"|".join(re.escape(marker) for marker in markers) + b"))")
+
+# Markers the fix strategies look for in the files they inspect
+_HELP_MARKERS = _marker_scanner(
+    b"raise Exception", b"Help functionality intentionally broken", b"def _show_help(self):", b"console.print"
+)
+_GOODBYE_MARKERS = _marker_scanner(
+    b"PRODUCTION TEST", b"Goodbye functionality broken", b"def _print_goodbye(self):", b"console.print"
+)
+_GRAPH_MARKERS = _marker_scanner(b"turn_count", b"max_turns")
+
+
+# Where GitHub delivers `issues` webhook events, the actions that get an
+# issue processed straight away, and those that make the agent forget it
+WEBHOOK_PATH = "/webhook/github"
+WEBHOOK_ACTIONS = frozenset({"opened", "labeled"})
+WEBHOOK_CLOSE_ACTIONS = frozenset({"closed", "deleted"})
+
+# Upper bound on open issues fetched, and on comments posted, per GraphQL request
+MAX_OPEN_ISSUES = 100
+MAX_COMMENTS_PER_MUTATION = 50
+
+# Issues in the given states updated since $since (all of them when null),
+# oldest update first so the high-water mark only moves forward
+OPEN_ISSUES_QUERY = """query($owner: String!, $name: String!, $first: Int!, $states: [IssueState!], $since: DateTime) {
+  repository(owner: $owner, name: $name) {
+    issues(states: $states, first: $first, filterBy: {since: $since}, orderBy: {field: UPDATED_AT, direction: ASC}) {
+      nodes { id number title body state updatedAt labels(first: 20) { nodes { name } } }
+    }
+  }
+}"""
+
+# Issue fields kept in the agent database: what analysis and fix comments need
+STORED_ISSUE_FIELDS = ("id", "number", "title", "body", "updatedAt", "labels")
+
+
+def make_webhook_server(port: int, secret: str, events: queue.Queue) -> http.server.ThreadingHTTPServer:
+    """Build the HTTP server that receives GitHub webhook deliveries.
+    
+    Deliveries with a valid signature are acknowledged and, for `issues`
+    events with an action the agent acts on, queued as (action, issue).
+    """
+    class WebhookHandler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != WEBHOOK_PATH:
+                self.send_error(404)
+                return
+            
+            payload = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            expected = "sha256=" + hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+            # compare_digest only accepts ASCII str, so compare the raw bytes
+            signature = self.headers.get("X-Hub-Signature-256", "")
+            if not hmac.compare_digest(expected.encode(), signature.encode("utf-8", "surrogateescape")):
+                self.send_error(401)
+                return
+            
+            self.send_response(204)
+            self.end_headers()
+            
+            if self.headers.get("X-GitHub-Event") == "issues":
+                try:
+                    event = json.loads(payload)
+                except json.JSONDecodeError:
+                    return
+                if not isinstance(event, dict) or not event.get("issue"):
+                    return
+                if event.get("action") in WEBHOOK_ACTIONS | WEBHOOK_CLOSE_ACTIONS:
+                    events.put((event["action"], event["issue"]))
+        
+        def log_message(self, format, *args):
+            pass  # deliveries are reported by the worker instead
+    
+    return http.server.ThreadingHTTPServer(("", port), WebhookHandler)
+
 
 class IssueMonitoringAgent:
     """Agent that monitors GitHub issues and attempts automated fixes"""
@@ -20,30 +164,198 @@ class IssueMonitoringAgent:
     def __init__(self, repo_path: str = ".", check_interval: int = 300):
         self.repo_path = Path(repo_path)
         self.check_interval = check_interval  # Check every 5 minutes by default
-        self.agent_db_path = self.repo_path / "agent_actions.json"
+        # Append-only log of agent database changes, folded back together on
+        # load; agent_actions.json is the older whole-database format
+        self.agent_db_path = self.repo_path / "agent_actions.jsonl"
+        self.legacy_agent_db_path = self.repo_path / "agent_actions.json"
+        
+        # Changes are buffered and appended at most every DB_FLUSH_INTERVAL
+        # seconds, at the end of each batch, and on exit
+        self._pending_events = []
+        self._events_since_compact = 0
+        self._last_db_flush = time.time()
         self.load_agent_database()
+        atexit.register(self.flush_agent_database)
         
+        # Resolve the CLI executables once rather than searching PATH per call
+        self._gh = shutil.which('gh') or 'gh'
+        self._git = shutil.which('git') or 'git'
+        
+        # Long-lived `git cat-file --batch-check`, started on first lookup
+        # and shut down by close(), at the latest on exit
+        self._git_batch = None
+        atexit.register(self.close)
+        
+        # The origin remote doesn't change during a run, so look it up once
+        self._repo_info = None
+        
+        # GraphQL node ids of fetched issues, and fix comments waiting to be
+        # posted together by flush_fix_comments()
+        self._issue_ids = {}
+        self._queued_comments = []
+        
+        # Source files inspected by the fix strategies, as {path: (mtime_ns, bytes)}
+        self._file_cache = {}
+        
+    @functools.cached_property
+    def _api_token(self) -> Optional[str]:
+        """The GitHub token, looked up on first use"""
+        return github_api.find_token(self.run_gh_command)
+    
+    @functools.cached_property
+    def _api_client(self) -> github_api.GitHubAPI:
+        """With a token, GitHub calls go straight to the API over one
+        keep-alive connection per thread instead of a `gh` process each"""
+        return github_api.GitHubAPI(self._api_token, "philosopher-dinner-issue-agent")
+    
     def load_agent_database(self):
-        """Load the agent action database"""
+        """Load the agent action database by replaying its change log"""
+        self.agent_db = {"processed_issues": {}, "fix_attempts": {}}
+        
         if self.agent_db_path.exists():
+            with open(self.agent_db_path, 'rb') as f:
+                for line in f:
+                    try:
+                        event = orjson.loads(line) if orjson is not None else json.loads(line)
+                    except ValueError:
+                        continue  # e.g. a line cut short by an interrupted write
+                    self._apply_event(event)
+                    self._events_since_compact += 1
+        
+        elif self.legacy_agent_db_path.exists():
             try:
-                with open(self.agent_db_path, 'r') as f:
-                    self.agent_db = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                self.agent_db = {"processed_issues": {}, "fix_attempts": {}}
+                with open(self.legacy_agent_db_path, 'rb') as f:
+                    data = f.read()
+                self.agent_db.update(orjson.loads(data) if orjson is not None else json.loads(data))
+            except (ValueError, FileNotFoundError):
+                return
+            # Carry the old database over into the log format
+            self.save_agent_database()
+    
+    def _apply_event(self, event: Dict):
+        """Fold one logged change into the in-memory database"""
+        section, key, value = event["section"], event["key"], event["value"]
+        table = self.agent_db if section is None else self.agent_db.setdefault(section, {})
+        if value is None:
+            table.pop(key, None)
         else:
-            self.agent_db = {"processed_issues": {}, "fix_attempts": {}}
+            table[key] = value
+    
+    def set_agent_record(self, section: Optional[str], key: str, value):
+        """Change one agent database entry and log the change.
+        
+        section=None addresses a top-level key; a value of None removes the entry.
+        """
+        event = {"ts": time.time(), "section": section, "key": key, "value": value}
+        self._apply_event(event)
+        self._pending_events.append(event)
+        self.mark_agent_database_dirty()
+    
+    @staticmethod
+    def _encode_events(events: List[Dict]) -> bytes:
+        """Serialize events as compact JSON lines"""
+        if orjson is not None:
+            return b"".join(orjson.dumps(event) + b"\n" for event in events)
+        return "".join(json.dumps(event, separators=(',', ':')) + "\n" for event in events).encode()
+    
+    def processed_recently(self, issue_number: str, window: float = 3600) -> bool:
+        """Check whether an issue was processed within the last `window` seconds"""
+        record = self.agent_db["processed_issues"].get(issue_number)
+        if record is None:
+            return False
+        
+        last_processed = record["last_processed"]
+        if isinstance(last_processed, str):
+            # Entries written before epoch timestamps were stored as ISO strings
+            last_processed = datetime.fromisoformat(last_processed).timestamp()
+        
+        return time.time() - last_processed < window
     
     def save_agent_database(self):
-        """Save the agent action database"""
-        with open(self.agent_db_path, 'w') as f:
-            json.dump(self.agent_db, f, indent=2)
+        """Rewrite the agent log as one entry per record, dropping superseded changes"""
+        now = time.time()
+        events = []
+        for section, table in self.agent_db.items():
+            if isinstance(table, dict):
+                events.extend({"ts": now, "section": section, "key": key, "value": value} for key, value in table.items())
+            else:
+                events.append({"ts": now, "section": None, "key": section, "value": table})
+        
+        tmp_path = self.agent_db_path.with_suffix('.jsonl.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(self._encode_events(events))
+        os.replace(tmp_path, self.agent_db_path)
+        
+        self._pending_events = []
+        self._events_since_compact = len(events)
+    
+    def mark_agent_database_dirty(self):
+        """Note an agent database change, writing it if the last write is old enough"""
+        if time.time() - self._last_db_flush >= DB_FLUSH_INTERVAL:
+            self.flush_agent_database()
+    
+    def flush_agent_database(self):
+        """Append buffered changes to the agent log, compacting it when it has grown long"""
+        if not self._pending_events:
+            return
+        
+        if self._events_since_compact + len(self._pending_events) >= DB_COMPACT_EVERY:
+            self.save_agent_database()
+        else:
+            with open(self.agent_db_path, 'ab') as f:
+                f.write(self._encode_events(self._pending_events))
+            self._events_since_compact += len(self._pending_events)
+            self._pending_events = []
+        
+        self._last_db_flush = time.time()
+    
+    def git_rev_parse(self, ref: str = "HEAD") -> Optional[str]:
+        """Resolve a ref to a commit hash without spawning git per lookup"""
+        try:
+            if self._git_batch is not None and self._git_batch.poll() is not None:
+                self._close_git_batch()
+            if self._git_batch is None:
+                self._git_batch = subprocess.Popen(
+                    [self._git, 'cat-file', '--batch-check'],
+                    cwd=self.repo_path,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    text=True
+                )
+            self._git_batch.stdin.write(f"{ref}\n")
+            self._git_batch.stdin.flush()
+            # "<hash> <type> <size>", or "<ref> missing" for unknown refs
+            fields = self._git_batch.stdout.readline().split()
+        except (OSError, ValueError):
+            self._close_git_batch()
+            return None
+        
+        return fields[0] if len(fields) == 3 else None
+    
+    def _close_git_batch(self):
+        """End the `git cat-file --batch-check` process, if one is running"""
+        if self._git_batch is None:
+            return
+        
+        proc, self._git_batch = self._git_batch, None
+        try:
+            proc.stdin.close()  # EOF makes git exit
+        except OSError:
+            pass
+        proc.wait()
+        proc.stdout.close()
+    
+    def close(self):
+        """Shut down the git batch process and any GitHub API connections"""
+        self._close_git_batch()
+        if "_api_client" in self.__dict__:
+            self._api_client.close()
     
     def run_gh_command(self, args: List[str]) -> Tuple[bool, str]:
         """Run a GitHub CLI command"""
         try:
             result = subprocess.run(
-                ['gh'] + args,
+                [self._gh] + args,
                 cwd=self.repo_path,
                 capture_output=True,
                 text=True
@@ -54,80 +366,204 @@ class IssueMonitoringAgent:
         except Exception as e:
             return False, str(e)
     
+    def _api(self, method, path, payload=None):
+        """Call the GitHub API on this thread's persistent connection"""
+        return self._api_client.request(method, path, payload)
+    
+    def post_comment(self, issue_number, body):
+        """Post a comment on an issue"""
+        if self._api_token:
+            return self._api(
+                'POST', f'/repos/{self.get_repo_info()}/issues/{issue_number}/comments', {'body': body}
+            )
+        return self.run_gh_command(['issue', 'comment', str(issue_number), '--body', body])
+    
+    def run_gh_graphql(self, query: str, **variables) -> Dict:
+        """Run a GraphQL query and return its data.
+        
+        Goes over the API connection when a token is available and through
+        `gh api graphql` otherwise.
+        """
+        if self._api_token:
+            success, output = self._api('POST', '/graphql', {'query': query, 'variables': variables})
+        else:
+            args = ['api', 'graphql', '-f', f'query={query}']
+            for name, value in variables.items():
+                # -f passes strings verbatim; -F keeps numbers typed; lists
+                # become name[]=item fields and None is left out (null)
+                if value is None:
+                    continue
+                if isinstance(value, list):
+                    for item in value:
+                        args += ['-f', f'{name}[]={item}']
+                else:
+                    args += ['-f' if isinstance(value, str) else '-F', f'{name}={value}']
+            
+            success, output = self.run_gh_command(args)
+        
+        if not success:
+            return {}
+        
+        try:
+            return json.loads(output).get("data") or {}
+        except json.JSONDecodeError:
+            return {}
+    
+    def get_repo_info(self):
+        """Get repository owner/name for URL construction"""
+        if self._repo_info is None:
+            self._repo_info = self._compute_repo_info()
+        return self._repo_info
+    
+    def _compute_repo_info(self):
+        """Read owner/name from the origin remote URL"""
+        try:
+            result = subprocess.run([
+                self._git, 'remote', 'get-url', 'origin'
+            ], capture_output=True, text=True, cwd=self.repo_path)
+            
+            if result.returncode == 0:
+                url = result.stdout.strip()
+                # Extract owner/repo from various URL formats
+                if 'github.com' in url:
+                    if url.startswith('git@'):
+                        # SSH format: git@github.com:owner/repo.git
+                        parts = url.split(':')[1].replace('.git', '')
+                    else:
+                        # HTTPS format: https://github.com/owner/repo.git
+                        parts = url.split('github.com/')[-1].replace('.git', '')
+                    return parts
+            
+            return "unknown/unknown"
+        except:
+            return "unknown/unknown"
+    
     def get_open_issues(self) -> List[Dict]:
-        """Get all open issues from GitHub"""
-        success, output = self.run_gh_command([
-            'issue', 'list', '--state', 'open', '--json', 
-            'number,title,body,labels,createdAt,updatedAt'
-        ])
+        """Get all open issues from GitHub.
         
-        if success:
-            try:
-                return json.loads(output)
-            except json.JSONDecodeError:
-                return []
-        return []
+        Only issues updated since the previous fetch are requested; the rest
+        come from the copy kept in the agent database.
+        """
+        cached = self.agent_db.setdefault("open_issues", {})
+        since = self.agent_db.get("issues_updated_since")
+        
+        owner, _, name = self.get_repo_info().partition('/')
+        data = self.run_gh_graphql(
+            OPEN_ISSUES_QUERY, owner=owner, name=name, first=MAX_OPEN_ISSUES,
+            # After the first fetch, closed issues are needed to drop them
+            states=["OPEN", "CLOSED"] if since else ["OPEN"], since=since
+        )
+        
+        # If the fetch failed, carry on with the issues known from last time
+        repository = data.get("repository")
+        updated = repository["issues"]["nodes"] if repository else []
+        for issue in updated:
+            if issue["state"] == "CLOSED":
+                self.forget_issue(issue["number"])
+            else:
+                # Same label shape as `gh issue list --json labels`
+                issue["labels"] = issue["labels"]["nodes"]
+                self.set_agent_record(
+                    "open_issues", str(issue["number"]),
+                    {field: issue[field] for field in STORED_ISSUE_FIELDS}
+                )
+        
+        if updated:
+            self.set_agent_record(None, "issues_updated_since", max(issue["updatedAt"] for issue in updated))
+        
+        for issue in cached.values():
+            self._issue_ids[issue["number"]] = issue["id"]
+        
+        # Forget analyses of issues that are no longer open
+        analysis_cache = self.agent_db.get("analysis_cache")
+        if analysis_cache:
+            for key in [key for key in analysis_cache if key not in cached]:
+                self.set_agent_record("analysis_cache", key, None)
+        
+        return list(cached.values())
     
     def analyze_issue(self, issue: Dict) -> Dict:
         """Analyze an issue to determine if it can be automatically fixed"""
         
         title = issue.get('title', '')
         body = issue.get('body', '')
-        labels = [label['name'] for label in issue.get('labels', [])]
+        label_names = frozenset(label['name'] for label in issue.get('labels', []))
         
         analysis = {
             "issue_number": issue['number'],
             "title": title,
-            "is_bug": 'bug' in labels or '🐛' in title,
-            "is_automated": 'automated' in labels or '[AUTO]' in title,
+            "is_bug": 'bug' in label_names or '🐛' in title,
+            "is_automated": 'automated' in label_names or '[AUTO]' in title,
             "fix_confidence": 0.0,
             "fix_strategy": None,
             "error_patterns": [],
             "test_names": []
         }
         
-        # Extract test names from the issue
-        test_matches = re.findall(r'test_[a-zA-Z_]+', body)
-        analysis["test_names"] = test_matches
-        
-        # Look for common error patterns
-        error_patterns = {
-            "import_error": r"ModuleNotFoundError|ImportError",
-            "assertion_error": r"AssertionError",
-            "attribute_error": r"AttributeError", 
-            "type_error": r"TypeError",
-            "recursion_error": r"RecursionError|maximum recursion depth",
-            "help_command_error": r"help.*command.*not.*work|Help functionality.*broken|_show_help.*error",
-            "cli_error": r"CLI.*error|command.*line.*interface",
-            "exception_in_help": r"Exception.*Help functionality.*broken|raise Exception.*help",
-            "goodbye_functionality_error": r"Goodbye functionality.*broken|_print_goodbye.*error|raise Exception.*goodbye",
-            "test_system_error": r"testing automated bug resolution system|PRODUCTION TEST"
-        }
+        # Extract test names and, for automated issues, the highest-priority
+        # error pattern, which determines fix confidence and strategy
+        test_names, best = _scan_issue_body(body, analysis["is_automated"])
+        analysis["test_names"] = list(test_names)
+        
+        if best is not None:
+            pattern_name, _, confidence, strategy = _ERROR_PATTERNS[best]
+            analysis["error_patterns"].append(pattern_name)
+            analysis["fix_confidence"] = confidence
+            analysis["fix_strategy"] = strategy
+        
+        return analysis
+    
+    def get_issue_analysis(self, issue: Dict) -> Dict:
+        """Analyze an issue, reusing the stored analysis while it is unchanged"""
+        updated_at = issue.get('updatedAt')
+        if not updated_at:
+            return self.analyze_issue(issue)
         
-        for pattern_name, pattern in error_patterns.items():
-            if re.search(pattern, body, re.IGNORECASE):
-                analysis["error_patterns"].append(pattern_name)
-        
-        # Determine fix confidence and strategy
-        if analysis["is_automated"] and analysis["test_names"]:
-            if "help_command_error" in analysis["error_patterns"] or "exception_in_help" in analysis["error_patterns"]:
-                analysis["fix_confidence"] = 0.9
-                analysis["fix_strategy"] = "fix_help_command"
-            elif "goodbye_functionality_error" in analysis["error_patterns"] or "test_system_error" in analysis["error_patterns"]:
-                analysis["fix_confidence"] = 0.95
-                analysis["fix_strategy"] = "fix_goodbye_functionality"
-            elif "import_error" in analysis["error_patterns"]:
-                analysis["fix_confidence"] = 0.6
-                analysis["fix_strategy"] = "fix_import_error"
-            elif "assertion_error" in analysis["error_patterns"]:
-                analysis["fix_confidence"] = 0.4
-                analysis["fix_strategy"] = "fix_assertion_error"
-            elif "recursion_error" in analysis["error_patterns"]:
-                analysis["fix_confidence"] = 0.7
-                analysis["fix_strategy"] = "fix_recursion_error"
+        # One entry per issue, replaced whenever the issue is updated
+        key = str(issue['number'])
+        cached = self.agent_db.get("analysis_cache", {}).get(key)
+        if cached is not None and cached["updatedAt"] == updated_at:
+            return cached["analysis"]
         
+        analysis = self.analyze_issue(issue)
+        self.set_agent_record("analysis_cache", key, {"updatedAt": updated_at, "analysis": analysis})
         return analysis
     
+    def forget_issue(self, number: int):
+        """Drop a closed issue and its analysis from the agent database"""
+        key = str(number)
+        for section in ("open_issues", "analysis_cache"):
+            if key in self.agent_db.get(section, {}):
+                self.set_agent_record(section, key, None)
+        self._issue_ids.pop(number, None)
+    
+    def _read_cached(self, path: Path) -> bytes:
+        """Read a file's bytes, reusing the last read while its mtime is unchanged"""
+        mtime = path.stat().st_mtime_ns
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        data = path.read_bytes()
+        self._file_cache[path] = (mtime, data)
+        return data
+    
+    @staticmethod
+    def _find_markers(data: bytes, scanner) -> set:
+        """Return the set of scanner markers that occur in data"""
+        return {match.group(1) for match in scanner.finditer(data)}
+    
+    def print_analysis(self, issue_number: str, analysis: Dict):
+        """Print an issue's analysis as one block with a single write"""
+        sys.stdout.write(
+            f"📊 Issue #{issue_number} Analysis:\n"
+            f"  Title: {analysis['title'][:50]}...\n"
+            f"  Is Bug: {analysis['is_bug']}\n"
+            f"  Is Automated: {analysis['is_automated']}\n"
+            f"  Fix Confidence: {analysis['fix_confidence']:.2f}\n"
+            f"  Fix Strategy: {analysis['fix_strategy']}\n"
+        )
+    
     def attempt_fix(self, analysis: Dict) -> Tuple[bool, str]:
         """Attempt to fix an issue based on analysis"""
         
@@ -160,15 +596,17 @@ class IssueMonitoringAgent:
         
         try:
             # Read the current file content
-            with open(file_path, 'r') as f:
-                content = f.read()
+            data = self._read_cached(file_path)
+            found = self._find_markers(data, _HELP_MARKERS)
             
             # Check if this is the specific bug we introduced
-            if "raise Exception" in content and "Help functionality intentionally broken" in content:
+            if b"raise Exception" in found and b"Help functionality intentionally broken" in found:
                 fix_details.append("🔍 Detected intentional test bug in help method")
                 
                 # Fix by restoring proper help functionality
-                fixed_content = content.replace(
+                # Normalize line endings as a text-mode read would, so the
+                # snippet below matches files checked out with CRLF
+                fixed_content = data.decode().replace("\r\n", "\n").replace(
                     '''    def _show_help(self):
         """Show help information"""
         # PRODUCTION TEST BUG: Completely break help method for GitHub issue demo
@@ -217,12 +655,12 @@ class IssueMonitoringAgent:
                 # General help command diagnostics
                 fix_details.append("🔍 Analyzing help command structure...")
                 
-                if "def _show_help(self):" in content:
+                if b"def _show_help(self):" in found:
                     fix_details.append("✅ _show_help method exists")
                 else:
                     fix_details.append("❌ _show_help method missing")
                 
-                if "console.print" in content:
+                if b"console.print" in found:
                     fix_details.append("✅ Rich console usage found")
                 else:
                     fix_details.append("⚠️  No Rich console usage detected")
@@ -275,10 +713,9 @@ class IssueMonitoringAgent:
         graph_file = self.repo_path / "philosopher_dinner/forum/graph.py"
         if graph_file.exists():
             try:
-                with open(graph_file, 'r') as f:
-                    content = f.read()
+                found = self._find_markers(self._read_cached(graph_file), _GRAPH_MARKERS)
                 
-                if "turn_count" in content and "max_turns" in content:
+                if b"turn_count" in found and b"max_turns" in found:
                     fixes_applied.append("✅ Turn limiting is implemented")
                 else:
                     fixes_applied.append("❌ Turn limiting may need to be added")
@@ -302,15 +739,16 @@ class IssueMonitoringAgent:
         
         try:
             # Read the current file content
-            with open(file_path, 'r') as f:
-                content = f.read()
+            data = self._read_cached(file_path)
+            found = self._find_markers(data, _GOODBYE_MARKERS)
             
             # Check if this is the specific test bug we introduced
-            if "PRODUCTION TEST" in content and "Goodbye functionality broken" in content:
+            if b"PRODUCTION TEST" in found and b"Goodbye functionality broken" in found:
                 fix_details.append("🔍 Detected intentional test bug in goodbye method")
                 
-                # Fix by restoring proper goodbye functionality
-                fixed_content = content.replace(
+                # Fix by restoring proper goodbye functionality (line endings
+                # normalized as in fix_help_command_issue)
+                fixed_content = data.decode().replace("\r\n", "\n").replace(
                     '''    def _print_goodbye(self):
         """Print goodbye message"""
         # PRODUCTION TEST: Intentional bug to test automated system
@@ -344,12 +782,12 @@ class IssueMonitoringAgent:
                 # General goodbye functionality diagnostics
                 fix_details.append("🔍 Analyzing goodbye functionality...")
                 
-                if "def _print_goodbye(self):" in content:
+                if b"def _print_goodbye(self):" in found:
                     fix_details.append("✅ _print_goodbye method exists")
                 else:
                     fix_details.append("❌ _print_goodbye method missing")
                 
-                if "console.print" in content:
+                if b"console.print" in found:
                     fix_details.append("✅ Rich console usage found")
                 else:
                     fix_details.append("⚠️  No Rich console usage detected")
@@ -363,13 +801,28 @@ class IssueMonitoringAgent:
             return False, "\n".join(fix_details)
     
     def run_tests_for_issue(self, analysis: Dict) -> bool:
-        """Run tests to check if an issue is resolved"""
+        """Run tests to check if an issue is resolved.
+        
+        Only the tests named in the issue are run when they are known to the
+        enhanced test runner; otherwise the whole runner is used.
+        """
+        from enhanced_test_runner import TEST_ADDRESSES
+        
+        # "tests.module:function" -> "tests/module.py::function"
+        node_ids = []
+        for test_name in dict.fromkeys(analysis["test_names"]):
+            address = TEST_ADDRESSES.get(test_name)
+            if address is not None:
+                module, _, function = address.partition(':')
+                node_ids.append(f"{module.replace('.', '/')}.py::{function}")
+        
+        if node_ids:
+            command = [sys.executable, '-m', 'pytest', '-x', '-q', '--no-header'] + node_ids
+        else:
+            command = [sys.executable, 'enhanced_test_runner.py']
         
         try:
-            # Run the enhanced test runner
-            result = subprocess.run([
-                sys.executable, 'enhanced_test_runner.py'
-            ], cwd=self.repo_path, capture_output=True, text=True)
+            result = subprocess.run(command, cwd=self.repo_path, capture_output=True, text=True)
             
             return result.returncode == 0
             
@@ -384,13 +837,8 @@ class IssueMonitoringAgent:
         
         if fix_success:
             # Get the current git commit hash for linking
-            try:
-                import subprocess
-                result = subprocess.run(['git', 'rev-parse', 'HEAD'], 
-                                      capture_output=True, text=True, cwd=self.repo_path)
-                current_commit = result.stdout.strip()[:8] if result.returncode == 0 else "unknown"
-            except:
-                current_commit = "unknown"
+            head = self.git_rev_parse("HEAD")
+            current_commit = head[:8] if head else "unknown"
             
             comment = f"""## 🤖 Automated Fix Attempt - SUCCESS
             
@@ -434,34 +882,51 @@ This fix will be included in the next commit. The commit hash will be: `{current
 *This fix attempt was automatically performed by the Issue Monitoring Agent*
 """
         
-        success, output = self.run_gh_command([
-            'issue', 'comment', issue_number, '--body', comment
-        ])
+        # Issues fetched through GraphQL get their comment in the next batch
+        subject_id = self._issue_ids.get(int(issue_number))
+        if subject_id is not None:
+            self._queued_comments.append((issue_number, subject_id, comment))
+            return True
         
+        success, output = self.post_comment(issue_number, comment)
         return success
     
+    def flush_fix_comments(self) -> int:
+        """Post queued fix comments with one GraphQL mutation per batch; returns how many failed"""
+        queued, self._queued_comments = self._queued_comments, []
+        failed = 0
+        
+        for start in range(0, len(queued), MAX_COMMENTS_PER_MUTATION):
+            batch = queued[start:start + MAX_COMMENTS_PER_MUTATION]
+            params = ", ".join(f"$s{i}: ID!, $b{i}: String!" for i in range(len(batch)))
+            fields = "\n  ".join(
+                f"c{i}: addComment(input: {{subjectId: $s{i}, body: $b{i}}}) {{ clientMutationId }}"
+                for i in range(len(batch))
+            )
+            variables = {}
+            for i, (_, subject_id, body) in enumerate(batch):
+                variables[f"s{i}"] = subject_id
+                variables[f"b{i}"] = body
+            
+            if not self.run_gh_graphql(f"mutation({params}) {{\n  {fields}\n}}", **variables):
+                failed += len(batch)
+                print(f"⚠️  Failed to post comments on issues: {', '.join('#' + n for n, _, _ in batch)}")
+        
+        return failed
+    
     def process_issue(self, issue: Dict) -> bool:
         """Process a single issue"""
         
         issue_number = str(issue['number'])
         
         # Check if we've already processed this issue recently
-        if issue_number in self.agent_db["processed_issues"]:
-            last_processed = datetime.fromisoformat(
-                self.agent_db["processed_issues"][issue_number]["last_processed"]
-            )
-            if datetime.now() - last_processed < timedelta(hours=1):
-                return False  # Skip if processed within last hour
+        if self.processed_recently(issue_number):
+            return False  # Skip if processed within last hour
         
         # Analyze the issue
-        analysis = self.analyze_issue(issue)
+        analysis = self.get_issue_analysis(issue)
         
-        print(f"📊 Issue #{issue_number} Analysis:")
-        print(f"  Title: {analysis['title'][:50]}...")
-        print(f"  Is Bug: {analysis['is_bug']}")
-        print(f"  Is Automated: {analysis['is_automated']}")
-        print(f"  Fix Confidence: {analysis['fix_confidence']:.2f}")
-        print(f"  Fix Strategy: {analysis['fix_strategy']}")
+        self.print_analysis(issue_number, analysis)
         
         # Only attempt fix if confidence is high enough
         if analysis["fix_confidence"] >= 0.4:
@@ -473,21 +938,19 @@ This fix will be included in the next commit. The commit hash will be: `{current
             self.create_fix_comment(issue_number, fix_success, fix_details)
             
             # Record the fix attempt
-            self.agent_db["fix_attempts"][issue_number] = {
+            self.set_agent_record("fix_attempts", issue_number, {
                 "timestamp": datetime.now().isoformat(),
                 "analysis": analysis,
                 "fix_success": fix_success,
                 "fix_details": fix_details
-            }
+            })
             
             # Record that we processed this issue
-            self.agent_db["processed_issues"][issue_number] = {
-                "last_processed": datetime.now().isoformat(),
+            self.set_agent_record("processed_issues", issue_number, {
+                "last_processed": time.time(),
                 "fix_attempted": True,
                 "fix_success": fix_success
-            }
-            
-            self.save_agent_database()
+            })
             
             return fix_success
         else:
@@ -521,6 +984,9 @@ This fix will be included in the next commit. The commit hash will be: `{current
                         if self.process_issue(issue):
                             fixed_count += 1
                     
+                    self.flush_fix_comments()
+                    self.flush_agent_database()
+                    
                     if fixed_count > 0:
                         print(f"  ✅ Successfully fixed {fixed_count} issues")
                     else:
@@ -537,6 +1003,91 @@ This fix will be included in the next commit. The commit hash will be: `{current
                 print(f"❌ Error in monitoring loop: {e}")
                 time.sleep(60)  # Wait 1 minute before retrying
     
+    @staticmethod
+    def _issue_from_webhook(issue: Dict) -> Dict:
+        """Convert a webhook (REST) issue into the shape get_open_issues() returns"""
+        return {
+            "id": issue["node_id"],
+            "number": issue["number"],
+            "title": issue["title"],
+            "body": issue.get("body") or "",
+            "updatedAt": issue["updated_at"],
+            "labels": [{"name": label["name"]} for label in issue.get("labels", [])]
+        }
+    
+    def handle_issue_event(self, issue: Dict) -> bool:
+        """Process an issue delivered by a webhook"""
+        issue = self._issue_from_webhook(issue)
+        self._issue_ids[issue["number"]] = issue["id"]
+        
+        fixed = self.process_issue(issue)
+        self.flush_fix_comments()
+        self.flush_agent_database()
+        return fixed
+    
+    def serve_webhooks(self, port: int, secret: str):
+        """Process issues as GitHub delivers `issues` webhook events.
+        
+        Deliveries are acknowledged right away and queued for one worker
+        thread, so fixes still run one at a time against the working tree.
+        """
+        events = queue.Queue()
+        
+        def worker():
+            while True:
+                action, issue = events.get()
+                if action in WEBHOOK_CLOSE_ACTIONS:
+                    self.forget_issue(issue["number"])
+                    self.flush_agent_database()
+                    continue
+                
+                print(f"\n📨 Webhook: issue #{issue['number']} {issue.get('title', '')[:50]}")
+                try:
+                    if self.handle_issue_event(issue):
+                        print(f"  ✅ Successfully fixed issue #{issue['number']}")
+                except Exception as e:
+                    print(f"❌ Error processing issue #{issue['number']}: {e}")
+        
+        threading.Thread(target=worker, daemon=True).start()
+        server = make_webhook_server(port, secret, events)
+        
+        print("🤖 ISSUE MONITORING AGENT LISTENING FOR WEBHOOKS")
+        print("=" * 50)
+        print(f"Endpoint: http://0.0.0.0:{port}{WEBHOOK_PATH}")
+        print(f"Repository: {self.repo_path.absolute()}")
+        print("=" * 50)
+        
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Issue monitoring agent stopped by user")
+        finally:
+            server.server_close()
+    
+    def register_webhook(self, url: str, secret: str) -> bool:
+        """Register an `issues` webhook for this repository pointing at url"""
+        hook = {
+            "name": "web",
+            "active": True,
+            "events": ["issues"],
+            "config": {"url": url, "content_type": "json", "secret": secret}
+        }
+        path = f"/repos/{self.get_repo_info()}/hooks"
+        
+        if self._api_token:
+            success, output = self._api('POST', path, hook)
+        else:
+            success, output = self.run_gh_command([
+                'api', path.lstrip('/'), '-f', 'name=web', '-F', 'active=true', '-f', 'events[]=issues',
+                '-f', f'config[url]={url}', '-f', 'config[content_type]=json', '-f', f'config[secret]={secret}'
+            ])
+        
+        if success:
+            print(f"✅ Registered issues webhook: {url}")
+        else:
+            print(f"❌ Failed to register webhook: {output}")
+        return success
+    
     def run_once(self):
         """Run the monitoring check once (for testing/manual execution)"""
         print("🤖 Running single issue monitoring check...")
@@ -554,6 +1105,9 @@ This fix will be included in the next commit. The commit hash will be: `{current
             if self.process_issue(issue):
                 fixed_count += 1
         
+        self.flush_fix_comments()
+        self.flush_agent_database()
+        
         print(f"  ✅ Successfully fixed {fixed_count} issues")
         
         # Show statistics
@@ -579,15 +1133,28 @@ def main():
     parser = argparse.ArgumentParser(description="Issue Monitoring Agent")
     parser.add_argument("--once", action="store_true", help="Run once instead of continuous monitoring")
     parser.add_argument("--interval", type=int, default=300, help="Check interval in seconds (default: 300)")
+    parser.add_argument("--poll", action="store_true", help="Poll for issues instead of listening for webhooks")
+    parser.add_argument("--port", type=int, default=8080, help="Webhook listener port (default: 8080)")
+    parser.add_argument("--register-webhook", metavar="URL", help="Register an issues webhook pointing at URL and exit")
     
     args = parser.parse_args()
     
+    # Shared with GitHub to sign webhook deliveries; without it the agent polls
+    secret = os.environ.get("GITHUB_WEBHOOK_SECRET")
+    
     agent = IssueMonitoringAgent(check_interval=args.interval)
     
     if args.once:
         agent.run_once()
-    else:
+    elif args.register_webhook:
+        if not secret:
+            print("❌ Set GITHUB_WEBHOOK_SECRET to register a webhook")
+            sys.exit(1)
+        sys.exit(0 if agent.register_webhook(args.register_webhook, secret) else 1)
+    elif args.poll or not secret:
         agent.monitor_issues()
+    else:
+        agent.serve_webhooks(args.port, secret)
 
 
 if __name__ == "__main__":
@@ -56,20 +56,26 @@ class BaseAgent(ABC):
         # Create system prompt for LLM
         self.system_prompt = self._create_system_prompt()
     
-    def evaluate_activation(self, state: ForumState) -> float:
+    def evaluate_activation(self, state: ForumState,
+                            breakdown: Optional[Dict[str, float]] = None) -> float:
         """
         Determine how activated this agent should be based on the current conversation.
         Returns a float between 0 and 1.
+        
+        Pass a dict as breakdown to have the components ("topic", "engagement",
+        "personality") filled in from the same pass.
         """
         if not state["messages"]:
+            if breakdown is not None:
+                breakdown.update(topic=0.0, engagement=0.0, personality=0.0)
             return 0.3  # Base activation for new conversations
         
         latest_message = state["messages"][-1]
+        content_lower = latest_message["content"].lower()
         activation = 0.0
         
         # Check for direct mention - if mentioned, boost activation significantly
         if latest_message["message_type"] == MessageType.HUMAN:
-            content_lower = latest_message["content"].lower()
             my_names = [self.name.lower(), self.agent_id.lower()]
             if any(name in content_lower for name in my_names):
                 activation += 0.8  # High boost for direct mentions
@@ -78,20 +84,30 @@ class BaseAgent(ABC):
         topic_relevance = self._calculate_topic_relevance(state["current_topic"])
         activation += topic_relevance * 0.4
         
-        # Conversation engagement
+        # Conversation engagement (own messages don't count; it is only
+        # worked out for them when a breakdown asks for it)
+        engagement = 0.0
         if latest_message["sender"] != self.agent_id:
-            engagement = self._calculate_engagement(latest_message["content"])
+            engagement = self._calculate_engagement(latest_message["content"], content_lower)
             activation += engagement * 0.3
+        elif breakdown is not None:
+            engagement = self._calculate_engagement(latest_message["content"], content_lower)
         
         # Personality-based activation
         personality_factor = self._calculate_personality_activation(state)
         activation += personality_factor * 0.3
         
+        if breakdown is not None:
+            breakdown.update(topic=topic_relevance, engagement=engagement, personality=personality_factor)
         return min(1.0, max(0.0, activation))
     
-    def should_respond(self, state: ForumState, activation_threshold: float = 0.6) -> bool:
-        """Determine if the agent should respond to the current state"""
-        activation = self.evaluate_activation(state)
+    def should_respond(self, state: ForumState, activation_threshold: float = 0.6,
+                       activation: Optional[float] = None) -> bool:
+        """Determine if the agent should respond to the current state.
+        Pass activation if it was already evaluated for this state.
+        """
+        if activation is None:
+            activation = self.evaluate_activation(state)
         
         # Don't respond to own messages
         if state["messages"] and state["messages"][-1]["sender"] == self.agent_id:
@@ -279,8 +295,11 @@ Respond authentically as {self.name} would."""
         
         return relevance
     
-    def _calculate_engagement(self, message_content: str) -> float:
+    def _calculate_engagement(self, message_content: str, content_lower: Optional[str] = None) -> float:
         """Calculate how engaging the latest message is for this agent"""
+        if content_lower is None:
+            content_lower = message_content.lower()
+        
         # Look for question marks, philosophical terms, etc.
         engagement = 0.3  # Base engagement
         
@@ -290,7 +309,7 @@ Respond authentically as {self.name} would."""
         # Look for key philosophical terms
         philosophical_terms = ["truth", "reality", "existence", "ethics", "morality", "justice"]
         for term in philosophical_terms:
-            if term in message_content.lower():
+            if term in content_lower:
                 engagement += 0.1
                 
         return min(1.0, engagement)
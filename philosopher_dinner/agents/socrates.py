@@ -2,7 +2,7 @@
 Socrates agent implementation.
 Embodies the Socratic method of questioning and philosophical inquiry.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import random
 
 from .base_agent import BaseAgent
@@ -169,9 +169,10 @@ class SocratesAgent(BaseAgent):
         
         return concepts[:3]  # Return up to 3 concepts
     
-    def should_respond(self, state: ForumState, activation_threshold: float = 0.5) -> bool:
+    def should_respond(self, state: ForumState, activation_threshold: float = 0.5,
+                       activation: Optional[float] = None) -> bool:
         """Socrates is quite active and loves to question"""
-        base_should_respond = super().should_respond(state, activation_threshold)
+        base_should_respond = super().should_respond(state, activation_threshold, activation)
         
         # Socrates is more likely to respond if someone makes a strong claim
         if state["messages"]:
@@ -125,11 +125,13 @@ class TestCoverageEnforcer:
             "cli_commands": [],
             "api_endpoints": []
         }
+        qualnames = self._qualified_names(tree)
         
         for node in ast.walk(tree):
             if isinstance(node, ast.FunctionDef):
                 func_info = {
                     "name": node.name,
+                    "qualname": qualnames[node],
                     "file": file_path,
                     "line": node.lineno,
                     "docstring": ast.get_docstring(node),
@@ -154,6 +156,7 @@ class TestCoverageEnforcer:
             elif isinstance(node, ast.AsyncFunctionDef):
                 func_info = {
                     "name": node.name,
+                    "qualname": qualnames[node],
                     "file": file_path,
                     "line": node.lineno,
                     "docstring": ast.get_docstring(node),
@@ -180,6 +183,21 @@ class TestCoverageEnforcer:
         
         return functionality
     
+    def _qualified_names(self, tree: ast.AST) -> Dict[ast.AST, str]:
+        """Map each function and class node to its dotted name, e.g. Class.method"""
+        names = {}
+        
+        def visit(node, prefix):
+            for child in ast.iter_child_nodes(node):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    names[child] = prefix + child.name
+                    visit(child, names[child] + ".")
+                else:
+                    visit(child, prefix)
+        
+        visit(tree, "")
+        return names
+    
     def _get_decorator_name(self, decorator):
         """Extract decorator name from AST node"""
         if isinstance(decorator, ast.Name):
@@ -11,7 +11,10 @@ from datetime import datetime
 # Add project to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from philosopher_dinner.agents.base_agent import BaseAgent
 from philosopher_dinner.agents.socrates import SocratesAgent
+from philosopher_dinner.agents.agent_factory import AgentFactory
+from philosopher_dinner.agents.forum_creator import ForumCreationAgent
 from philosopher_dinner.forum.state import ForumConfig, ForumMode, Message, MessageType
 
 
@@ -286,6 +289,72 @@ class TestAgentActivation:
         should_respond = self.socrates.should_respond(test_state)
         assert not should_respond, "Should not respond to own messages"
 
+class TestShouldRespondSignature:
+    """Test every agent accepts an already-evaluated activation"""
+    
+    def setup_method(self):
+        """Set up one agent of every class"""
+        factory = AgentFactory()
+        self.agents = [SocratesAgent(), ForumCreationAgent()] + [
+            factory.create_agent(agent_id) for agent_id in factory.get_available_agents()
+        ]
+        self.config = ForumConfig(
+            forum_id="test",
+            name="Test",
+            description="Test",
+            mode=ForumMode.EXPLORATION,
+            participants=["socrates"],
+            created_at=datetime.now(),
+            settings={}
+        )
+    
+    def test_should_respond_takes_activation(self):
+        """Test should_respond(state, threshold, activation) on every agent class"""
+        test_message = Message(
+            id="test-signature",
+            sender="human",
+            content="Let's discuss ethics",
+            message_type=MessageType.HUMAN,
+            timestamp=datetime.now(),
+            thinking=None,
+            metadata={}
+        )
+        
+        test_state = {
+            "messages": [test_message],
+            "current_topic": "ethics",
+            "active_speakers": ["human"],
+            "forum_config": self.config,
+            "participants": ["socrates"],
+            "agent_memories": {},
+            "agent_activations": {},
+            "turn_count": 1,
+            "last_speaker": "human",
+            "waiting_for_human": False,
+            "session_id": "test",
+            "created_at": datetime.now(),
+            "last_updated": datetime.now()
+        }
+        
+        checked = set()
+        for agent in self.agents:
+            activation = agent.evaluate_activation(test_state)
+            
+            # Passing the activation gives the same answer as evaluating it again
+            for threshold in (0.0, 0.3, 0.6, 1.0):
+                assert agent.should_respond(test_state, threshold, activation) == \
+                    agent.should_respond(test_state, threshold), f"{agent.agent_id} @ {threshold}"
+            checked.add(type(agent))
+        
+        # Every agent class in the package is covered
+        def subclasses(cls):
+            for sub in cls.__subclasses__():
+                yield sub
+                yield from subclasses(sub)
+        
+        agent_classes = {cls for cls in subclasses(BaseAgent) if cls.__module__.startswith("philosopher_dinner.")}
+        assert agent_classes <= checked, f"Unchecked agents: {agent_classes - checked}"
+
 
 def run_agent_tests():
     """Run all agent behavior tests and report results"""
@@ -302,7 +371,8 @@ def run_agent_tests():
     # Test classes to run
     test_classes = [
         TestSocratesAuthenticity(),
-        TestAgentActivation()
+        TestAgentActivation(),
+        TestShouldRespondSignature()
     ]
     
     for test_class in test_classes:
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Test the GitHub issue manager's bookkeeping without talking to GitHub.
+Git and GraphQL calls are replaced with fakes that record what was asked.
+"""
+
+import sys
+import os
+import json
+import subprocess
+
+# Add project to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from github_issue_manager import GitHubIssueManager
+
+
+def write_bug_db(repo_path, tracked=None, resolved=None):
+    """Write a bug_tracking.json for a manager to load"""
+    with open(repo_path / "bug_tracking.json", 'w') as f:
+        json.dump({"tracked_bugs": tracked or {}, "resolved_bugs": resolved or {}}, f)
+
+
+def tracked_bug(test_name, issue_number, error_message="boom"):
+    """A tracked_bugs entry as flush_pending_issues() records it"""
+    return {
+        "issue_number": issue_number,
+        "test_name": test_name,
+        "error_message": error_message,
+        "created_at": "2025-01-01T00:00:00",
+        "status": "open"
+    }
+
+
+class TestGitLookups:
+    """Test git is consulted once per manager, not once per bug"""
+    
+    def test_resolving_many_bugs_runs_git_at_most_once(self, tmp_path, monkeypatch):
+        """Test resolve_bug_issue reuses the origin remote and HEAD lookups"""
+        # A loose-ref HEAD so the commit is read from .git, not from git
+        (tmp_path / ".git" / "refs" / "heads").mkdir(parents=True)
+        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        (tmp_path / ".git" / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+        
+        test_names = [f"test_case_{i}" for i in range(20)]
+        write_bug_db(tmp_path, tracked={
+            GitHubIssueManager.make_bug_id(name, "boom"): tracked_bug(name, str(i))
+            for i, name in enumerate(test_names)
+        })
+        
+        git_calls = []
+        
+        def fake_run(args, *a, **kw):
+            git_calls.append(args)
+            return subprocess.CompletedProcess(args, 0, stdout="https://github.com/owner/repo.git\n", stderr="")
+        
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        
+        manager = GitHubIssueManager(str(tmp_path))
+        for name in test_names:
+            assert manager.resolve_bug_issue(name)
+        
+        assert len(git_calls) <= 1, f"git ran {len(git_calls)} times: {git_calls}"
+        assert len(manager._pending_close) == len(test_names)
+        assert all("a" * 40 in message for message in manager._pending_close.values())
+
+
+class FakeGraphQL:
+    """Stand-in for _run_graphql that answers the repository lookup and the
+    batched mutation, recording each request"""
+    
+    def __init__(self, fail_lookup=False, fail_mutation=False, missing_issues=()):
+        self.fail_lookup = fail_lookup
+        self.fail_mutation = fail_mutation
+        self.missing_issues = missing_issues
+        self.requests = []
+    
+    def __call__(self, query, variables):
+        self.requests.append((query, variables))
+        if query.startswith("query"):
+            if self.fail_lookup:
+                return None
+            repository = {"id": "R", "labels": {"nodes": [{"id": "L1", "name": "bug"}]}}
+            for i in range(query.count("issue(number:")):
+                repository[f"i{i}"] = None if i in self.missing_issues else {"id": f"I{i}"}
+            return {"repository": repository}
+        
+        if self.fail_mutation:
+            return None
+        data = {}
+        for name in variables:
+            if name.startswith("c"):
+                data[name] = {"issue": {"number": 100 + int(name[1:])}}
+            elif name.startswith("k"):
+                data[name] = {"issue": {"number": 1}}
+        return data
+
+
+class TestBatchedFlush:
+    """Test queued issue creations and closures are sent together"""
+    
+    def make_manager(self, tmp_path, graphql):
+        """Build a manager with one tracked bug and fake GitHub access"""
+        write_bug_db(tmp_path, tracked={
+            GitHubIssueManager.make_bug_id("test_old", "boom"): tracked_bug("test_old", "7")
+        })
+        manager = GitHubIssueManager(str(tmp_path))
+        manager._repo_info = "owner/repo"
+        manager._head_sha = "b" * 40
+        manager._run_graphql = graphql
+        return manager
+    
+    def test_flush_sends_one_lookup_and_one_mutation(self, tmp_path):
+        """Test creations and closures share a single GraphQL mutation"""
+        graphql = FakeGraphQL()
+        manager = self.make_manager(tmp_path, graphql)
+        
+        manager.create_bug_issue("test_a", "error a", "output a")
+        manager.create_bug_issue("test_b", "error b", "output b")
+        assert manager.resolve_bug_issue("test_old")
+        
+        filed, closed = manager.flush_pending_issues()
+        
+        assert len(graphql.requests) == 2
+        mutation, variables = graphql.requests[1]
+        assert mutation.startswith("mutation")
+        assert {"c0", "c1", "a0", "k0"} <= variables.keys()
+        assert variables["c0"]["labelIds"] == ["L1"]
+        
+        assert filed == {"test_a": "100", "test_b": "101"}
+        assert closed == ["7"]
+        assert manager.get_bug_statistics()["currently_tracked"] == 2
+        assert manager.get_bug_statistics()["resolved_bugs"] == 1
+        assert not manager._pending_create and not manager._pending_close
+    
+    def test_failed_lookup_keeps_queued_issues(self, tmp_path):
+        """Test nothing queued is lost when the repository lookup fails"""
+        graphql = FakeGraphQL(fail_lookup=True)
+        manager = self.make_manager(tmp_path, graphql)
+        
+        manager.create_bug_issue("test_a", "error a", "output a")
+        assert manager.resolve_bug_issue("test_old")
+        
+        assert manager.flush_pending_issues() == ({}, [])
+        assert len(manager._pending_create) == 1
+        assert len(manager._pending_close) == 1
+        
+        # The next flush retries and succeeds
+        graphql.fail_lookup = False
+        filed, closed = manager.flush_pending_issues()
+        assert filed == {"test_a": "100"}
+        assert closed == ["7"]
+    
+    def test_failed_mutation_keeps_queued_issues(self, tmp_path):
+        """Test operations the mutation did not carry out stay queued"""
+        manager = self.make_manager(tmp_path, FakeGraphQL(fail_mutation=True))
+        
+        manager.create_bug_issue("test_a", "error a", "output a")
+        assert manager.resolve_bug_issue("test_old")
+        
+        assert manager.flush_pending_issues() == ({}, [])
+        assert len(manager._pending_create) == 1
+        assert len(manager._pending_close) == 1
+        assert manager.get_bug_statistics()["currently_tracked"] == 1
+    
+    def test_missing_issue_is_resolved_locally(self, tmp_path):
+        """Test a closure whose issue no longer exists is not retried forever"""
+        graphql = FakeGraphQL(missing_issues={0})
+        manager = self.make_manager(tmp_path, graphql)
+        
+        assert manager.resolve_bug_issue("test_old")
+        
+        assert manager.flush_pending_issues() == ({}, [])
+        # Only the lookup was sent; there was nothing to mutate
+        assert len(graphql.requests) == 1
+        assert not manager._pending_close
+        assert manager.get_bug_statistics()["currently_tracked"] == 0
+        assert manager.get_bug_statistics()["resolved_bugs"] == 1
+        
+        bug_id = GitHubIssueManager.make_bug_id("test_old", "boom")
+        assert manager.bug_db["resolved_bugs"][bug_id]["status"] == "resolved_issue_missing"
+        assert manager._db_dirty
+
+
+class TestLegacyBugIds:
+    """Test bugs filed under the old hash() ids are carried over"""
+    
+    def test_legacy_ids_are_rekeyed_on_load(self, tmp_path):
+        """Test old per-process ids become stable digests and are saved"""
+        write_bug_db(
+            tmp_path,
+            tracked={"test-test_a-1234": tracked_bug("test_a", "3", "error a")},
+            resolved={"test-test_b-42": {**tracked_bug("test_b", "4", "error b"), "status": "resolved"}}
+        )
+        
+        manager = GitHubIssueManager(str(tmp_path))
+        new_a = GitHubIssueManager.make_bug_id("test_a", "error a")
+        new_b = GitHubIssueManager.make_bug_id("test_b", "error b")
+        
+        assert list(manager.bug_db["tracked_bugs"]) == [new_a]
+        assert list(manager.bug_db["resolved_bugs"]) == [new_b]
+        assert manager._by_test_name["test_a"] == [new_a]
+        
+        # The same failure is recognised as already tracked
+        assert manager.create_bug_issue("test_a", "error a", "output") == "3"
+        assert not manager._pending_create
+        
+        manager.flush_bug_database()
+        with open(tmp_path / "bug_tracking.json") as f:
+            saved = json.load(f)
+        assert list(saved["tracked_bugs"]) == [new_a]
+        assert list(saved["resolved_bugs"]) == [new_b]
+    
+    def test_current_ids_are_left_alone(self, tmp_path):
+        """Test a database without legacy ids is not rewritten"""
+        bug_id = GitHubIssueManager.make_bug_id("test_a", "error a")
+        write_bug_db(tmp_path, tracked={bug_id: tracked_bug("test_a", "3", "error a")})
+        
+        manager = GitHubIssueManager(str(tmp_path))
+        
+        assert list(manager.bug_db["tracked_bugs"]) == [bug_id]
+        assert not manager._db_dirty
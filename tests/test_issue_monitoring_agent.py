@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Test the issue monitoring agent's local state and issue triage.
+Nothing here talks to GitHub or changes the working tree.
+"""
+
+import sys
+import os
+import json
+import hmac
+import hashlib
+import queue
+import threading
+import http.client
+import re
+import itertools
+import subprocess
+
+# Add project to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import issue_monitoring_agent
+from issue_monitoring_agent import IssueMonitoringAgent
+
+
+def read_log(agent):
+    """Return the events in an agent's JSONL log"""
+    with open(agent.agent_db_path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestAgentLog:
+    """Test the agent database round-trips through its change log"""
+    
+    def test_log_replays_into_same_database(self, tmp_path):
+        """Test a new agent rebuilds the database from appended changes"""
+        agent = IssueMonitoringAgent(str(tmp_path))
+        agent.set_agent_record("processed_issues", "1", {"last_processed": 1.0, "success": True})
+        agent.set_agent_record("processed_issues", "2", {"last_processed": 2.0, "success": False})
+        agent.set_agent_record("processed_issues", "2", None)
+        agent.set_agent_record(None, "issues_updated_since", "2025-01-01T00:00:00Z")
+        agent.flush_agent_database()
+        
+        assert len(read_log(agent)) == 4
+        
+        reloaded = IssueMonitoringAgent(str(tmp_path))
+        assert reloaded.agent_db == agent.agent_db
+        assert reloaded.agent_db["processed_issues"] == {"1": {"last_processed": 1.0, "success": True}}
+        assert reloaded.agent_db["issues_updated_since"] == "2025-01-01T00:00:00Z"
+    
+    def test_truncated_line_is_skipped(self, tmp_path):
+        """Test a line cut short by an interrupted write doesn't stop the replay"""
+        agent = IssueMonitoringAgent(str(tmp_path))
+        agent.set_agent_record("fix_attempts", "1", {"strategy": "fix_help_command"})
+        agent.flush_agent_database()
+        with open(agent.agent_db_path, 'a') as f:
+            f.write('{"ts": 1, "section": "fix_att')
+        
+        reloaded = IssueMonitoringAgent(str(tmp_path))
+        assert reloaded.agent_db["fix_attempts"] == {"1": {"strategy": "fix_help_command"}}
+    
+    def test_log_is_compacted_once_long(self, tmp_path, monkeypatch):
+        """Test superseded changes are dropped when the log reaches DB_COMPACT_EVERY"""
+        monkeypatch.setattr(issue_monitoring_agent, "DB_COMPACT_EVERY", 10)
+        agent = IssueMonitoringAgent(str(tmp_path))
+        
+        for i in range(9):
+            agent.set_agent_record("fix_attempts", "1", {"attempt": i})
+        agent.flush_agent_database()
+        assert len(read_log(agent)) == 9
+        
+        agent.set_agent_record("fix_attempts", "1", {"attempt": 9})
+        agent.flush_agent_database()
+        
+        # One line per record: the two default sections are empty
+        events = read_log(agent)
+        assert [(e["section"], e["key"], e["value"]) for e in events] == [("fix_attempts", "1", {"attempt": 9})]
+        assert not (tmp_path / "agent_actions.jsonl.tmp").exists()
+        
+        reloaded = IssueMonitoringAgent(str(tmp_path))
+        assert reloaded.agent_db == agent.agent_db
+    
+    def test_legacy_database_is_converted(self, tmp_path):
+        """Test an agent_actions.json database is carried over into the log"""
+        legacy = {
+            "processed_issues": {"5": {"last_processed": "2025-01-01T12:00:00", "success": True}},
+            "fix_attempts": {}
+        }
+        with open(tmp_path / "agent_actions.json", 'w') as f:
+            json.dump(legacy, f)
+        
+        agent = IssueMonitoringAgent(str(tmp_path))
+        
+        assert agent.agent_db["processed_issues"] == legacy["processed_issues"]
+        assert agent.agent_db_path.exists()
+        assert IssueMonitoringAgent(str(tmp_path)).agent_db == agent.agent_db
+
+
+class TestGitBatch:
+    """Test the long-lived git lookup process is shut down"""
+    
+    def test_close_ends_git_batch_process(self, tmp_path):
+        """Test close() ends the cat-file process and lookups restart it"""
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "--allow-empty", "-m", "init"],
+            cwd=tmp_path, check=True
+        )
+        agent = IssueMonitoringAgent(str(tmp_path))
+        
+        head = agent.git_rev_parse("HEAD")
+        assert head and len(head) == 40
+        proc = agent._git_batch
+        
+        agent.close()
+        assert agent._git_batch is None
+        assert proc.returncode == 0
+        
+        # A later lookup starts a fresh process
+        assert agent.git_rev_parse("HEAD") == head
+        assert agent.git_rev_parse("no-such-ref") is None
+        agent.close()
+
+
+class TestWebhookServer:
+    """Test webhook deliveries are authenticated before they are queued"""
+    
+    SECRET = "webhook-secret"
+    
+    def setup_method(self):
+        """Start a webhook server on a free port"""
+        self.events = queue.Queue()
+        self.server = issue_monitoring_agent.make_webhook_server(0, self.SECRET, self.events)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def teardown_method(self):
+        """Stop the webhook server"""
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def deliver(self, payload, signature=None, path=issue_monitoring_agent.WEBHOOK_PATH):
+        """POST an `issues` event and return the response status"""
+        body = json.dumps(payload).encode()
+        if signature is None:
+            signature = "sha256=" + hmac.new(self.SECRET.encode(), body, hashlib.sha256).hexdigest()
+        conn = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=5)
+        try:
+            conn.request("POST", path, body=body, headers={
+                "X-GitHub-Event": "issues",
+                "X-Hub-Signature-256": signature,
+                "Content-Type": "application/json"
+            })
+            return conn.getresponse().status
+        finally:
+            conn.close()
+    
+    def test_bad_signature_is_rejected(self):
+        """Test a delivery signed with the wrong secret gets 401 and is not queued"""
+        payload = {"action": "opened", "issue": {"number": 1}}
+        forged = "sha256=" + hmac.new(b"wrong-secret", json.dumps(payload).encode(), hashlib.sha256).hexdigest()
+        
+        assert self.deliver(payload, signature=forged) == 401
+        assert self.deliver(payload, signature="") == 401
+        assert self.events.empty()
+    
+    def test_non_ascii_signature_is_rejected(self):
+        """Test a signature header with non-ASCII bytes gets 401 rather than an error"""
+        payload = {"action": "opened", "issue": {"number": 1}}
+        
+        assert self.deliver(payload, signature="sha256=\xe9".encode("latin-1")) == 401
+        assert self.events.empty()
+    
+    def test_delivery_without_issue_is_not_queued(self):
+        """Test a signed delivery missing its issue is acknowledged but dropped"""
+        assert self.deliver({"action": "opened"}) == 204
+        assert self.deliver({"action": "opened", "issue": {"number": 2}}) == 204
+        
+        # Only the second delivery is queued
+        assert self.events.get(timeout=5) == ("opened", {"number": 2})
+        assert self.events.empty()
+    
+    def test_signed_delivery_is_queued(self):
+        """Test a correctly signed delivery is acknowledged and queued"""
+        payload = {"action": "opened", "issue": {"number": 1}}
+        
+        assert self.deliver(payload) == 204
+        # Acknowledged before it is queued, so allow the handler a moment
+        assert self.events.get(timeout=5) == ("opened", {"number": 1})
+    
+    def test_other_actions_and_paths_are_ignored(self):
+        """Test only the handled actions on the webhook path are queued"""
+        assert self.deliver({"action": "edited", "issue": {"number": 1}}) == 204
+        assert self.deliver({"action": "opened", "issue": {"number": 2}}, path="/other") == 404
+        assert self.deliver({"action": "closed", "issue": {"number": 3}}) == 204
+        
+        # Neither of the first two deliveries is queued, so the close comes first
+        assert self.events.get(timeout=5) == ("closed", {"number": 3})
+
+
+def reference_strategy(body, is_automated):
+    """Fix confidence and strategy as chosen by the original one-search-per-pattern
+    if/elif chain that _ERROR_PATTERN_RE replaced"""
+    error_patterns = {
+        "import_error": r"ModuleNotFoundError|ImportError",
+        "assertion_error": r"AssertionError",
+        "recursion_error": r"RecursionError|maximum recursion depth",
+        "help_command_error": r"help.*command.*not.*work|Help functionality.*broken|_show_help.*error",
+        "exception_in_help": r"Exception.*Help functionality.*broken|raise Exception.*help",
+        "goodbye_functionality_error": r"Goodbye functionality.*broken|_print_goodbye.*error|raise Exception.*goodbye",
+        "test_system_error": r"testing automated bug resolution system|PRODUCTION TEST"
+    }
+    found = [name for name, pattern in error_patterns.items() if re.search(pattern, body, re.IGNORECASE)]
+    
+    if not (is_automated and re.findall(r'test_[a-zA-Z_]+', body)):
+        return 0.0, None
+    if "help_command_error" in found or "exception_in_help" in found:
+        return 0.9, "fix_help_command"
+    if "goodbye_functionality_error" in found or "test_system_error" in found:
+        return 0.95, "fix_goodbye_functionality"
+    if "import_error" in found:
+        return 0.6, "fix_import_error"
+    if "assertion_error" in found:
+        return 0.4, "fix_assertion_error"
+    if "recursion_error" in found:
+        return 0.7, "fix_recursion_error"
+    return 0.0, None
+
+
+# Body fragments that trip each error pattern, plus some that nearly do
+ERROR_SNIPPETS = [
+    "the help command does not work",
+    "Help functionality intentionally broken",
+    "_show_help raised an error",
+    'raise Exception("help me")',
+    "Goodbye functionality broken - testing",
+    "_print_goodbye threw an error",
+    "raise Exception in goodbye",
+    "testing automated bug resolution system",
+    "PRODUCTION TEST",
+    "ModuleNotFoundError: No module named 'rich'",
+    "ImportError: cannot import name",
+    "AssertionError: expected 3",
+    "RecursionError: maximum recursion depth exceeded",
+    "help\ncommand not work",
+    "goodbye works fine",
+]
+
+
+class TestErrorPatternScan:
+    """Test the fused error pattern scan picks what the if/elif chain picked"""
+    
+    def test_strategy_matches_original_selection(self, tmp_path):
+        """Test every combination of up to three error snippets, in both orders"""
+        agent = IssueMonitoringAgent(str(tmp_path))
+        
+        bodies = []
+        for n in range(4):
+            for combo in itertools.permutations(ERROR_SNIPPETS, n):
+                if n == 3 and combo != tuple(sorted(combo)):
+                    continue  # keep the suite quick; pairs already cover order
+                bodies.append("\n".join(("Test `test_cli_help` failed",) + combo))
+                bodies.append(" ".join(combo))
+        
+        for body in bodies:
+            for title in ("🐛 [AUTO] Bug in test_cli_help", "Manual report"):
+                issue = {"number": 1, "title": title, "body": body, "labels": []}
+                analysis = agent.analyze_issue(issue)
+                expected = reference_strategy(body, "[AUTO]" in title)
+                assert (analysis["fix_confidence"], analysis["fix_strategy"]) == expected, body
+    
+    def test_winning_pattern_is_reported(self, tmp_path):
+        """Test the pattern that chose the strategy is listed in error_patterns"""
+        agent = IssueMonitoringAgent(str(tmp_path))
+        issue = {
+            "number": 1,
+            "title": "[AUTO] Bug",
+            "body": "test_quit failed: AssertionError\nPRODUCTION TEST",
+            "labels": [{"name": "bug"}]
+        }
+        
+        analysis = agent.analyze_issue(issue)
+        
+        assert analysis["error_patterns"] == ["test_system_error"]
+        assert analysis["fix_strategy"] == "fix_goodbye_functionality"
+        assert analysis["test_names"] == ["test_quit"]
@@ -2,11 +2,18 @@
 """
 Development file watcher that automatically runs tests when code changes.
 Provides immediate feedback during development.
+
+When started with --paths-from, only the listed files are stat'ed on each
+poll instead of walking the watched directories, and bursts of saves are
+debounced into a single test run. The list is read once at startup: new
+files are not picked up until the watcher is restarted, and a listed file
+that disappears counts as changed.
 """
 
 import os
 import sys
 import time
+import argparse
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -35,8 +42,22 @@ def scan_directory(directory, extensions=None):
     
     return files
 
+def scan_paths(paths):
+    """Stat an explicit list of files; missing files get an mtime of 0"""
+    return {file_path: get_file_mtime(file_path) for file_path in paths}
+
+def read_paths_file(paths_file):
+    """Read one file path per line from a --paths-from file"""
+    with open(paths_file) as f:
+        return [line.strip() for line in f if line.strip()]
+
 def run_tests():
-    """Run the test suite"""
+    """Run the test suite.
+    
+    The suite always runs in a fresh interpreter, even when the watcher is
+    imported in-process, so edited modules are re-imported rather than
+    served stale from sys.modules.
+    """
     print(f"\n🧪 Running tests at {datetime.now().strftime('%H:%M:%S')}")
     print("=" * 60)
     
@@ -75,8 +96,49 @@ def run_tests():
     finally:
         os.chdir(original_dir)
 
-def main():
+def find_changed_files(current_files, new_files):
+    """List files that were modified, added or deleted between two scans"""
+    changed_files = []
+    
+    # Check for modified files. Any mtime change counts, so a listed file
+    # that went missing (mtime 0) or was restored to an older copy is caught
+    for file_path, mtime in new_files.items():
+        if file_path in current_files:
+            if mtime != current_files[file_path]:
+                changed_files.append(file_path)
+        else:
+            # New file
+            changed_files.append(file_path)
+    
+    # Check for deleted files
+    for file_path in current_files:
+        if file_path not in new_files:
+            changed_files.append(file_path)
+    
+    return changed_files
+
+def main(argv=None):
     """Main file watcher loop"""
+    parser = argparse.ArgumentParser(description="Re-run tests when Python files change")
+    parser.add_argument(
+        "--paths-from",
+        help="File listing the paths to watch, one per line, read once at startup "
+             "(default: walk the watch directories)"
+    )
+    parser.add_argument(
+        "--debounce-ms",
+        type=int,
+        default=200,
+        help="Wait until changes have been quiet this long before running tests"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between change checks"
+    )
+    args = parser.parse_args(argv)
+    
     print("🔍 PHILOSOPHER DINNER - DEVELOPMENT TEST WATCHER")
     print("=" * 60)
     print("Watching for Python file changes...")
@@ -89,45 +151,46 @@ def main():
         'tests'
     ]
     
+    if args.paths_from:
+        watch_paths = read_paths_file(args.paths_from)
+        scan = lambda: scan_paths(watch_paths)
+    else:
+        def scan():
+            files = {}
+            for directory in watch_dirs:
+                if os.path.exists(directory):
+                    files.update(scan_directory(directory))
+            return files
+    
     # Get initial file states
-    current_files = {}
-    for directory in watch_dirs:
-        if os.path.exists(directory):
-            current_files.update(scan_directory(directory))
+    current_files = scan()
     
-    print(f"📁 Watching {len(current_files)} Python files in {len(watch_dirs)} directories")
+    if args.paths_from:
+        print(f"📁 Watching {len(current_files)} Python files from {args.paths_from}")
+    else:
+        print(f"📁 Watching {len(current_files)} Python files in {len(watch_dirs)} directories")
     
     # Run tests initially
     run_tests()
     
     try:
         while True:
-            time.sleep(1)  # Check every second
+            time.sleep(args.poll_interval)
             
-            # Check for file changes
-            new_files = {}
-            for directory in watch_dirs:
-                if os.path.exists(directory):
-                    new_files.update(scan_directory(directory))
-            
-            # Find changed files
-            changed_files = []
-            
-            # Check for modified files
-            for file_path, mtime in new_files.items():
-                if file_path in current_files:
-                    if mtime > current_files[file_path]:
-                        changed_files.append(file_path)
-                else:
-                    # New file
-                    changed_files.append(file_path)
-            
-            # Check for deleted files
-            for file_path in current_files:
-                if file_path not in new_files:
-                    changed_files.append(file_path)
+            new_files = scan()
+            changed_files = find_changed_files(current_files, new_files)
             
             if changed_files:
+                # Let a burst of saves settle so it triggers a single run
+                debounce = args.debounce_ms / 1000
+                while debounce > 0:
+                    time.sleep(debounce)
+                    settled_files = scan()
+                    if settled_files == new_files:
+                        break
+                    new_files = settled_files
+                changed_files = find_changed_files(current_files, new_files)
+                
                 print(f"\n📝 File changes detected:")
                 for file_path in changed_files:
                     relative_path = os.path.relpath(file_path)